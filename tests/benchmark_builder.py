@@ -0,0 +1,66 @@
+import json
+import random
+import string
+import timeit
+from urllib.parse import urlencode
+
+from tweety.builder import REQUEST_PLATFORMS, UrlBuilder
+
+N = 20_000
+builder = UrlBuilder()
+builder.guest_token = "1234567890123456789"
+
+
+def uncached_headers():
+    # what every request used to pay for: a fresh dict, platform and csrf token
+    headers = dict(builder._build_headers(builder.guest_token, ""))
+    headers["sec-ch-ua-platform"] = f'"{random.choice(REQUEST_PLATFORMS)}"'
+    headers["x-csrf-token"] = "".join(
+        random.choices(string.ascii_letters + string.digits, k=32)
+    )
+    return headers
+
+
+def uncached_user_tweets(cursor):
+    variables = {"rest_id": "44196397", "count": 40, "cursor": cursor}
+    params = {
+        "variables": str(json.dumps(variables)),
+        "features": str(json.dumps(UrlBuilder.GQL_FEATURES)),
+    }
+    url = "?".join([UrlBuilder.URL_USER_TWEETS, urlencode(params)])
+    return dict(method="GET", headers=uncached_headers(), url=url)
+
+
+def run_uncached():
+    for i in range(N):
+        uncached_user_tweets(str(i))
+
+
+def run_builder():
+    for i in range(N):
+        builder.user_tweets(44196397, cursor=str(i))
+
+
+def run_uncached_trends():
+    for _ in range(N):
+        url = "?".join([UrlBuilder.URL_TRENDS, urlencode(UrlBuilder.TRENDS_PARAMS)])
+        dict(method="GET", headers=uncached_headers(), url=url)
+
+
+def run_builder_trends():
+    for _ in range(N):
+        builder.trends()
+
+
+print("-------------------------")
+print(f"BUILDING {N} REQUESTS")
+print("-------------------------")
+for name, slow_fn, fast_fn in (
+    ("user_tweets", run_uncached, run_builder),
+    ("trends", run_uncached_trends, run_builder_trends),
+):
+    slow = min(timeit.repeat(slow_fn, number=1, repeat=3))
+    fast = min(timeit.repeat(fast_fn, number=1, repeat=3))
+    print(f"{name} uncached: {N / slow:,.0f} requests/s")
+    print(f"{name} cached:   {N / fast:,.0f} requests/s")
+    print(f"speed-up:        {slow / fast:.1f}x")
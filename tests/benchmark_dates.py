@@ -0,0 +1,46 @@
+import random
+import timeit
+
+import dateutil.parser
+
+from tweety.types.twDataTypes import MONTHS, parse_date
+
+# 10k tweets worth of `created_at` values, roughly one author date for every ten tweets
+DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+random.seed(0)
+fixture = [
+    "{} {} {:02d} {:02d}:{:02d}:{:02d} +0000 {}".format(
+        random.choice(DAYS),
+        random.choice(list(MONTHS)),
+        random.randint(1, 28),
+        random.randint(0, 23),
+        random.randint(0, 59),
+        random.randint(0, 59),
+        random.randint(2007, 2023),
+    )
+    for _ in range(10_000)
+]
+fixture += random.sample(fixture, 1_000)
+
+assert all(parse_date(i) == dateutil.parser.parse(i) for i in fixture)
+
+
+def run_dateutil():
+    for date in fixture:
+        dateutil.parser.parse(date)
+
+
+def run_parse_date():
+    parse_date.cache_clear()
+    for date in fixture:
+        parse_date(date)
+
+
+print("-------------------------")
+print(f"PARSING {len(fixture)} TIMESTAMPS")
+print("-------------------------")
+slow = min(timeit.repeat(run_dateutil, number=1, repeat=3))
+fast = min(timeit.repeat(run_parse_date, number=1, repeat=3))
+print(f"dateutil.parser.parse: {slow:.4f}s")
+print(f"parse_date:            {fast:.4f}s")
+print(f"speed-up:              {slow / fast:.1f}x")
@@ -0,0 +1,89 @@
+"""
+HTTP/1.1 against HTTP/2 with the connection limits used by `RequestMaker`, against a local
+h2c (cleartext HTTP/2) stand-in server which answers every request after a fixed delay.
+Needs `pip install httpx[http2] hypercorn`.
+"""
+import asyncio
+import json
+import socket
+import sys
+import time
+
+import httpx
+
+from tweety.http import _get_limits
+
+try:
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+except ImportError:
+    print("hypercorn is not installed, skipping")
+    sys.exit(0)
+
+REQUESTS = 1_000
+CONNECTIONS = 10
+LATENCY = 0.02
+BODY = json.dumps({"data": {"user": {"result": {"rest_id": "44196397"}}}}).encode()
+
+
+async def app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+
+    await asyncio.sleep(LATENCY)
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": BODY})
+
+
+def get_free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run(url, http2):
+    # http1=False makes httpx speak HTTP/2 without TLS, like it would over ALPN to twitter.com
+    async with httpx.AsyncClient(
+        http1=not http2, http2=http2, limits=_get_limits(CONNECTIONS)
+    ) as client:
+        await client.get(url)
+        started = time.perf_counter()
+        responses = await asyncio.gather(*(client.get(url) for _ in range(REQUESTS)))
+        elapsed = time.perf_counter() - started
+
+    assert all(i.status_code == 200 for i in responses)
+    assert {i.http_version for i in responses} == {"HTTP/2" if http2 else "HTTP/1.1"}
+    return REQUESTS / elapsed
+
+
+async def main():
+    port = get_free_port()
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.loglevel = "WARNING"
+    config.keep_alive_max_requests = REQUESTS * 10
+    shutdown = asyncio.Event()
+    server = asyncio.ensure_future(serve(app, config, shutdown_trigger=shutdown.wait))
+    await asyncio.sleep(0.5)
+
+    url = f"http://127.0.0.1:{port}/"
+    print("-------------------------")
+    print(f"{REQUESTS} REQUESTS, {CONNECTIONS} CONNECTIONS, {LATENCY * 1000:.0f}ms SERVER LATENCY")
+    print("-------------------------")
+    http1 = await run(url, http2=False)
+    http2 = await run(url, http2=True)
+    print(f"HTTP/1.1: {http1:,.0f} requests/s")
+    print(f"HTTP/2:   {http2:,.0f} requests/s")
+    print(f"speed-up: {http2 / http1:.1f}x")
+
+    shutdown.set()
+    await server
+
+
+asyncio.run(main())
@@ -0,0 +1,83 @@
+import asyncio
+import threading
+import time
+
+from tweety.bot import _map_concurrent, _map_concurrent_async
+
+started = []
+lock = threading.Lock()
+
+
+def crawl(item):
+    with lock:
+        started.append(item)
+
+    time.sleep(0.5)
+    return item * 2
+
+
+print("-------------------------")
+print("RESULTS AND ERRORS")
+print("-------------------------")
+
+
+def half(item):
+    if item == 3:
+        raise ValueError(item)
+
+    return item / 2
+
+
+results = dict(_map_concurrent(half, range(6), 2))
+assert isinstance(results.pop(3), ValueError)
+assert results == {0: 0, 1: 0.5, 2: 1, 4: 2, 5: 2.5}
+print("ok")
+
+print("-------------------------")
+print("STOPPING AFTER THE FIRST RESULT")
+print("-------------------------")
+begin = time.perf_counter()
+results = _map_concurrent(crawl, range(100), 2)
+for item, result in results:
+    assert result == item * 2
+    break
+
+results.close()
+elapsed = time.perf_counter() - begin
+# the queued calls are cancelled, only the running ones are left to finish
+assert elapsed < 1, elapsed
+time.sleep(0.6)
+assert len(started) <= 4, started
+print(f"ok, {len(started)} of 100 calls started")
+
+print("-------------------------")
+print("ASYNC STOPPING AFTER THE FIRST RESULT")
+print("-------------------------")
+cancelled = []
+
+
+async def crawl_async(item):
+    try:
+        await asyncio.sleep(0.1 if item == 0 else 10)
+    except asyncio.CancelledError:
+        cancelled.append(item)
+        raise
+
+    return item * 2
+
+
+async def main():
+    begin = time.perf_counter()
+    results = _map_concurrent_async(crawl_async, range(100), 4)
+    async for item, result in results:
+        assert (item, result) == (0, 0)
+        break
+
+    await results.aclose()
+    await asyncio.sleep(0)
+    assert time.perf_counter() - begin < 1
+    assert sorted(cancelled) == [1, 2, 3], cancelled
+
+
+asyncio.run(main())
+print("ok")
@@ -0,0 +1,130 @@
+import asyncio
+import os
+import re
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from tweety.download import AsyncChunkedDownloader, ChunkedDownloader
+
+PAYLOAD = os.urandom(5 * 1024 * 1024 + 123)
+
+
+class Handler(BaseHTTPRequestHandler):
+    ranges = True
+    # drop the connection of every ranged response after this many bytes
+    cut_after = None
+    served = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_head(200, len(PAYLOAD))
+        self.end_headers()
+
+    def do_GET(self):
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        if not match or not self.ranges:
+            self.send_head(200, len(PAYLOAD))
+            self.end_headers()
+            self.write(PAYLOAD)
+            return
+
+        start, end = int(match.group(1)), int(match.group(2))
+        body = PAYLOAD[start : end + 1]
+        self.send_head(206, len(body))
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")
+        self.end_headers()
+        if self.cut_after is not None:
+            self.write(body[: self.cut_after])
+            self.connection.close()
+            return
+
+        self.write(body)
+
+    def send_head(self, status, length):
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        self.send_header("ETag", '"payload"')
+        if self.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+
+    def write(self, body):
+        Handler.served += len(body)
+        self.wfile.write(body)
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = f"http://127.0.0.1:{server.server_address[1]}/video.mp4"
+directory = tempfile.mkdtemp()
+
+
+def read(filename):
+    with open(filename, "rb") as f:
+        return f.read()
+
+
+print("-------------------------")
+print("SEGMENTED DOWNLOAD")
+print("-------------------------")
+filename = os.path.join(directory, "full.mp4")
+with httpx.Client() as client:
+    ChunkedDownloader(client, segments=4).download(url, filename, False)
+assert read(filename) == PAYLOAD
+assert not os.path.exists(f"{filename}.part")
+assert not os.path.exists(f"{filename}.part.json")
+print("ok")
+
+print("-------------------------")
+print("INTERRUPTED DOWNLOAD RESUMES")
+print("-------------------------")
+filename = os.path.join(directory, "resumed.mp4")
+Handler.cut_after = 256 * 1024
+with httpx.Client() as client:
+    try:
+        ChunkedDownloader(client, segments=4).download(url, filename, False)
+        raise AssertionError("the download should have been interrupted")
+    except httpx.HTTPError:
+        pass
+
+assert not os.path.exists(filename)
+assert os.path.exists(f"{filename}.part.json")
+
+Handler.cut_after = None
+Handler.served = 0
+with httpx.Client() as client:
+    ChunkedDownloader(client, segments=4).download(url, filename, False)
+assert read(filename) == PAYLOAD
+assert Handler.served <= len(PAYLOAD) - 4 * 256 * 1024, Handler.served
+print(f"ok, {Handler.served} of {len(PAYLOAD)} bytes fetched again")
+
+print("-------------------------")
+print("SERVER WITHOUT RANGES")
+print("-------------------------")
+filename = os.path.join(directory, "sequential.mp4")
+Handler.ranges = False
+with httpx.Client() as client:
+    ChunkedDownloader(client, segments=4).download(url, filename, False)
+assert read(filename) == PAYLOAD
+Handler.ranges = True
+print("ok")
+
+print("-------------------------")
+print("ASYNC SEGMENTED DOWNLOAD")
+print("-------------------------")
+
+
+async def main():
+    filename = os.path.join(directory, "async.mp4")
+    async with httpx.AsyncClient() as client:
+        await AsyncChunkedDownloader(client, segments=4).download(url, filename, False)
+    assert read(filename) == PAYLOAD
+
+
+asyncio.run(main())
+print("ok")
+server.shutdown()
@@ -0,0 +1,42 @@
+from tweety.types.twDataTypes import LazyTweet, Tweet
+
+USER = {
+    "rest_id": "1000",
+    "legacy": {
+        "created_at": "Wed Oct 10 20:19:24 +0000 2018",
+        "name": "user",
+        "screen_name": "user",
+        "followers_count": 10,
+    },
+}
+RAW_TWEET = {
+    "rest_id": "1",
+    "core": {"user_result": {"result": USER}},
+    "views": {"count": "12"},
+    "legacy": {
+        "created_at": "Thu Jun 01 12:00:00 +0000 2023",
+        "full_text": "hello #x",
+        "lang": "en",
+        "favorite_count": 3,
+        "retweet_count": 1,
+        "source": '<a href="x">Twitter Web App</a>',
+        "entities": {
+            "hashtags": [{"text": "x"}],
+            "urls": [],
+            "user_mentions": [],
+            "symbols": [],
+        },
+    },
+}
+
+print("-------------------------")
+print("LAZY TWEETS MATCH TWEETS")
+print("-------------------------")
+tweet = Tweet(None, RAW_TWEET, None)
+lazy = LazyTweet(None, RAW_TWEET, None)
+assert lazy.get("likes") == 3 and "hashtags" in lazy
+assert dict(LazyTweet(None, RAW_TWEET, None)) == dict(tweet)
+assert len(LazyTweet(None, RAW_TWEET, None)) == len(tweet)
+assert len(lazy) == len(lazy.keys()) == len(tweet)
+assert list(lazy) == list(tweet)
+print("ok")
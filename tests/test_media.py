@@ -0,0 +1,100 @@
+from tweety.download import download_all, get_unique_media
+from tweety.types.records import to_record
+from tweety.types.twDataTypes import Media
+
+
+def get_video(variants, duration_millis=10_000):
+    return Media(
+        {
+            "type": "video",
+            "media_key": "7_1",
+            "media_url_https": "https://pbs.twimg.com/media/1.jpg",
+            "sizes": {},
+            "video_info": {
+                "duration_millis": duration_millis,
+                "aspect_ratio": [16, 9],
+                "variants": variants,
+            },
+        },
+        None,
+    )
+
+
+def get_variant(width, height, bitrate=None):
+    variant = {
+        "content_type": "video/mp4",
+        "url": f"https://video.twimg.com/vid/{width}x{height}/{width}.mp4",
+    }
+    if bitrate is not None:
+        variant["bitrate"] = bitrate
+
+    return variant
+
+
+class Tweet:
+    def __init__(self, media):
+        self.media = media
+
+
+# 10s: 256000 bps is 320KB, 832000 bps 1.04MB and 2176000 bps 2.72MB
+video = get_video(
+    [
+        {"content_type": "application/x-mpegURL", "url": "https://video.twimg.com/pl.m3u8"},
+        get_variant(480, 270, 256_000),
+        get_variant(640, 360, 832_000),
+        get_variant(1280, 720, 2_176_000),
+    ]
+)
+
+print("-------------------------")
+print("CLOSEST")
+print("-------------------------")
+assert video.best_stream("closest", 400).height == 360
+assert video.best_stream("closest", (1200, 700)).height == 720
+try:
+    video.best_stream("closest")
+    raise AssertionError("closest without a target should raise")
+except ValueError:
+    pass
+print("ok")
+
+print("-------------------------")
+print("BUDGET")
+print("-------------------------")
+assert video.best_stream("budget", max_bytes=2_000_000).height == 360
+# nothing fits, the smallest one is the closest to the budget
+assert video.best_stream("budget", max_bytes=1000).height == 270
+print("ok")
+
+print("-------------------------")
+print("UNKNOWN SIZES COME LAST")
+print("-------------------------")
+unsized = get_video([get_variant(320, 180), get_variant(480, 270, 256_000)])
+assert unsized.streams[0].size is None
+assert unsized.best_stream("budget", max_bytes=1000).height == 270
+print("ok")
+
+print("-------------------------")
+print("POLICY CHECKED BEFORE ANY DOWNLOAD")
+print("-------------------------")
+media = get_unique_media([Tweet([video])], "closest", 720)
+assert [url for _, url in media.values()] == [video.streams[2].url]
+for kwargs in (
+    {"policy": "closest"},
+    {"policy": "budget"},
+    {"policy": "smallest"},
+):
+    try:
+        download_all([Tweet([video])], None, show_progress=False, **kwargs)
+        raise AssertionError(f"{kwargs} should raise")
+    except ValueError:
+        pass
+print("ok")
+
+print("-------------------------")
+print("STREAM RECORDS")
+print("-------------------------")
+record = to_record(video.streams[1])
+assert (record.width, record.height, record.pixels) == (640, 360, 640 * 360)
+assert record.size == video.streams[1].size == 1_040_000
+print("ok")
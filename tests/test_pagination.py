@@ -0,0 +1,45 @@
+from tweety.bot import Twitter
+
+
+class Timeline:
+    """
+    Stands in for `RequestMaker.get_tweets`: every page holds no Tweet but a cursor to the next one
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_tweets(self, user_id, replies=False, cursor=None):
+        self.calls += 1
+        entries = [
+            {
+                "entryId": "cursor-bottom-1",
+                "content": {"cursorType": "Bottom", "value": str(self.calls)},
+            }
+        ]
+        instructions = [{"__typename": "TimelineAddEntries", "entries": entries}]
+        timeline = {"timeline": {"instructions": instructions}}
+        return {"data": {"user_result": {"result": {"timeline_response": timeline}}}}
+
+
+app = Twitter(lazy=True)
+
+print("-------------------------")
+print("A SINGLE TUPLE WITH EVERY PAGE BY DEFAULT")
+print("-------------------------")
+app.request = Timeline()
+results = list(app.iter_tweets(1, pages=3, wait_time=0))
+assert len(results) == 1 and results[0][1] == []
+assert app.request.calls == 3
+print("ok")
+
+print("-------------------------")
+print("PER PAGE STOPS WITH THE CONSUMER")
+print("-------------------------")
+app.request = Timeline()
+for user_tweets, tweets in app.iter_tweets(1, pages=10, wait_time=0, per_page=True):
+    assert user_tweets.cursor == "1"
+    break
+
+assert app.request.calls == 1, app.request.calls
+print("ok")
@@ -0,0 +1,52 @@
+import httpx
+
+from tweety.http import _parse_response
+from tweety.retry import WAIT_FOR_RESET, RetryPolicy, get_retry_reason
+
+policy = RetryPolicy(jitter=False)
+request = httpx.Request("GET", "https://twitter.com/i/api/graphql/x/UserResultByScreenNameQuery")
+
+
+def get_error(status_code, content=b"<html>nope</html>"):
+    response = httpx.Response(status_code, content=content, request=request)
+    try:
+        _parse_response(response)
+    except Exception as error:
+        return error
+
+    raise AssertionError(f"{status_code} should have raised")
+
+
+print("-------------------------")
+print("NON JSON ERROR BODIES GO BY THEIR STATUS")
+print("-------------------------")
+for status_code in (400, 401, 403, 404):
+    error = get_error(status_code)
+    assert policy.get_rule(error) is False, status_code
+    assert policy.get_delay(error, "GET", 0) is None, status_code
+
+for status_code in (500, 502, 503, 504):
+    error = get_error(status_code)
+    assert policy.get_rule(error) is True, status_code
+    assert get_retry_reason(error) == str(status_code)
+
+error = get_error(501)
+assert policy.get_delay(error, "GET", 0) is None
+print("ok")
+
+print("-------------------------")
+print("429 WAITS FOR THE RESET")
+print("-------------------------")
+error = get_error(429)
+assert policy.get_rule(error) == WAIT_FOR_RESET
+assert 42 <= policy.get_delay(error, "GET", 0, reset_delay=42) <= 43
+print("ok")
+
+print("-------------------------")
+print("ERROR CODES OF SUCCESSFUL RESPONSES")
+print("-------------------------")
+# an empty body with a successful status is still worth another try
+assert policy.get_rule(get_error(200, b"")) is True
+error = get_error(200, b'{"errors": [{"code": 88, "message": "Rate limit exceeded"}]}')
+assert policy.get_rule(error) == WAIT_FOR_RESET
+print("ok")
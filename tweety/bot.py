@@ -1,14 +1,25 @@
+import asyncio
 import functools
 import re
-from typing import Literal, Optional, Union
-
-from tweety.types.searchtweet import SearchTweets
-
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterable, Literal, Optional, Union
+
+from tweety.types.searchtweet import AsyncSearchTweets, SearchTweets
+
+from .cache import ResponseCache, UserIdCache
+from .conversation import (
+    AsyncConversationExpander,
+    ConversationExpander,
+    get_conversation_tweets,
+    get_tweet_id,
+)
 from .exceptions import *
-from .http import RequestMaker
+from .http import AsyncRequestMaker, RequestMaker
+from .proxy import ProxyPool
+from .retry import RetryPolicy
 from .types.n_types import Proxy, SearchFilter
 from .types.twDataTypes import Trends, Tweet, User
-from .types.usertweet import UserTweets
+from .types.usertweet import AsyncUserTweets, UserTweets
 
 
 def AuthRequired(f):
@@ -22,20 +33,172 @@ def AuthRequired(f):
     return wrapper
 
 
+def _map_concurrent(func, items: Iterable, concurrency: int):
+    """
+    Run `func` over `items` on `concurrency` threads, yielding `(item, result)` as each call
+    completes. Exceptions are yielded as the result so one failure doesn't stop the batch.
+    Only a bounded number of calls are queued at any time, and the ones not started yet are
+    cancelled when the consumer stops early instead of being waited for.
+    """
+
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = {}
+    try:
+        while True:
+            for item in items:
+                pending[executor.submit(func, item)] = item
+                if len(pending) >= concurrency * 2:
+                    break
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                yield item, future.exception() or future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+        # the calls already running finish in the background
+        executor.shutdown(wait=False)
+
+
+async def _map_concurrent_async(func, items: Iterable, concurrency: int):
+    """
+    `asyncio` counterpart of `_map_concurrent`, `func` has to be a coroutine function
+    """
+
+    items = iter(items)
+    pending = {}
+    try:
+        while True:
+            for item in items:
+                pending[asyncio.ensure_future(func(item))] = item
+                if len(pending) >= concurrency:
+                    break
+
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = pending.pop(task)
+                yield item, task.exception() or task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _get_user_key(username: Union[str, int, User]) -> tuple:
+    if isinstance(username, User):
+        return "id", str(username.rest_id)
+
+    if isinstance(username, int) or str(username).isdigit():
+        return "id", str(username)
+
+    # screen names are case-insensitive
+    return "username", UserIdCache.get_key(username)
+
+
+def _get_unique_usernames(usernames: Iterable[Union[str, int, User]]) -> list:
+    # `User` is an unhashable dict, dedupe on its id and keep the first object given for each user
+    unique = {}
+    for username in usernames:
+        unique.setdefault(_get_user_key(username), username)
+
+    return list(unique.values())
+
+
+def _parse_user(
+    user_raw: dict, banner_extensions: bool = False, image_extensions: bool = False
+) -> User:
+    if not banner_extensions or banner_extensions is False:
+        try:
+            del user_raw["data"]["user_result"]["result"]["legacy"][
+                "profile_banner_extensions"
+            ]
+        except KeyError:
+            pass
+
+    if not image_extensions or image_extensions is False:
+        try:
+            del user_raw["data"]["user_result"]["result"]["legacy"][
+                "profile_image_extensions"
+            ]
+        except KeyError:
+            pass
+
+    return User(user_raw["data"]["user_result"]["result"])
+
+
+def _parse_tweet_detail(
+    r: dict, tweet_id: str, http, details: Optional[dict] = None
+) -> Tweet:
+    # every instruction is looked at, like `iter_conversation` does
+    for raw_tweet in get_conversation_tweets(r):
+        if get_tweet_id(raw_tweet) == str(tweet_id):
+            return Tweet(r, raw_tweet, http, True, False, True, details)
+
+    raise InvalidTweetIdentifier(144, "StatusNotFound", r)
+
+
 class Twitter:
     def __init__(
         self,
         max_retries: int = 10,
-        proxy: Optional[Union[dict, Proxy]] = None,
+        proxy: Optional[Union[dict, str, Proxy, list, ProxyPool]] = None,
+        max_connections: Optional[int] = None,
+        rate_limit: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        guest_tokens: int = 1,
+        lazy: Union[bool, str] = False,
+        http2: bool = False,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = 5.0,
+        cache: Optional[Union[ResponseCache, str]] = None,
+        user_ids: Optional[UserIdCache] = None,
     ):
         """
         Constructor of the Twitter Public class
 
-        :param max_retries: (`int`) Number of retries the script would make , if the guest token wasn't found
-        :param proxy: (`dict` or `Proxy`) Provide the proxy you want to use while making a request
+        :param max_retries: (`int`) kept for compatibility, the guest token request is retried by `retry_policy`
+        :param proxy: (`dict`, `str` or `Proxy`) Provide the proxy you want to use while making a request.
+                      A `list` of proxies or a `ProxyPool` spreads the requests across all of them
+        :param max_connections: (`int`) Maximum number of connections opened to Twitter at the same time
+        :param rate_limit: (`bool`) pace the requests with the `x-rate-limit-*` headers sent by Twitter,
+                           which makes a `wait_time` of 0 safe when paginating
+        :param retry_policy: (`RetryPolicy`) how failed requests are retried, see `RequestMaker.stats` for the counts
+        :param guest_tokens: (`int`) number of guest tokens requests are spread across, kept warm in the background
+        :param lazy: (`bool` or `str`) don't touch the network in the constructor. `True` fetches the guest token
+                     on the first request, `"background"` starts fetching it right away in a background thread
+        :param http2: (`bool`) talk HTTP/2 to Twitter, multiplexing concurrent requests over one connection.
+                      Needs the `h2` package, i.e. `pip install httpx[http2]`
+        :param max_keepalive_connections: (`int`) idle connections kept open, defaults to `max_connections` or 20
+        :param keepalive_expiry: (`float`) seconds an idle connection is kept open, `None` keeps them forever
+        :param cache: (`ResponseCache` or `str`) keep the responses on disk and serve repeated requests from it,
+                      a `str` is the path of the SQLite database
+        :param user_ids: (`UserIdCache`) where the screen names are resolved to user ids, pass the same instance
+                         to several clients to share it. Every client gets its own in-memory one by default
         """
 
-        self.request = RequestMaker(max_retries=max_retries, proxy=proxy)
+        self.request = RequestMaker(
+            max_retries=max_retries,
+            proxy=proxy,
+            max_connections=max_connections,
+            rate_limit=rate_limit,
+            retry_policy=retry_policy,
+            guest_tokens=guest_tokens,
+            lazy=lazy,
+            http2=http2,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            cache=cache,
+        )
+        self.user_ids = UserIdCache() if user_ids is None else user_ids
+        self.conversations = ConversationExpander(self.request)
 
     def get_user_info(
         self,
@@ -54,24 +217,33 @@ class Twitter:
         """
 
         user_raw = self.request.get_user(username)
+        user = _parse_user(user_raw, banner_extensions, image_extensions)
+        self.user_ids.set(username, user.rest_id)
+        return user
 
-        if not banner_extensions or banner_extensions is False:
-            try:
-                del user_raw["data"]["user_result"]["result"]["legacy"][
-                    "profile_banner_extensions"
-                ]
-            except KeyError:
-                pass
+    def get_users(
+        self,
+        usernames: Iterable[str],
+        concurrency: int = 8,
+        banner_extensions: bool = False,
+        image_extensions: bool = False,
+    ):
+        """
+         Get the User Info of many usernames, looked up concurrently over the shared connection pool
 
-        if not image_extensions or image_extensions is False:
-            try:
-                del user_raw["data"]["user_result"]["result"]["legacy"][
-                    "profile_image_extensions"
-                ]
-            except KeyError:
-                pass
+        :param usernames: (`list[str]`) usernames to get information of, duplicates are looked up once
+        :param concurrency: (`int`) number of lookups made at the same time
+        :param banner_extensions: (`boolean`) Get the Banner extension on the user pages
+        :param image_extensions: (`boolean`) Get the Image extension on the user pages
+
+        :return: generator of (username, .types.twDataTypes.User) as soon as each lookup is done,
+                 the exception (e.g. `UserNotFound`) is given instead of the User if that lookup failed
+        """
+
+        def _get_user(username):
+            return self.get_user_info(username, banner_extensions, image_extensions)
 
-        return User(user_raw["data"]["user_result"]["result"])
+        return _map_concurrent(_get_user, _get_unique_usernames(usernames), concurrency)
 
     def _get_user_id(
         self,
@@ -84,7 +256,9 @@ class Twitter:
         elif isinstance(username, str) and str(username).isdigit():
             user_id = int(username)
         else:
-            user_id = self.get_user_info(username).rest_id
+            user_id = (
+                self.user_ids.get(username) or self.get_user_info(username).rest_id
+            )
 
         return user_id
 
@@ -96,6 +270,8 @@ class Twitter:
         retweets: bool = False,
         wait_time: int = 2,
         cursor: Optional[str] = None,
+        retain: Union[bool, int] = True,
+        lazy: bool = False,
     ):
         """
          Get the tweets from a user
@@ -107,6 +283,8 @@ class Twitter:
         :param: wait_time: (`int`) seconds to wait between multiple requests
         :param: cursor: Pagination cursor if you want to get the pages
                         from that cursor up-to (This cursor is different from actual API cursor)
+        :param: retain: (`boolean` | `int`) keep every Tweet on the result (`True`) or only the last `n` Tweets
+        :param: lazy: (`boolean`) return `LazyTweet` objects which only parse the fields that are read
 
         :return: .types.usertweet.UserTweets
         """
@@ -116,14 +294,66 @@ class Twitter:
         user_id = self._get_user_id(username)
 
         user_tweets = UserTweets(
-            user_id, self.request, pages, replies, retweets, wait_time, cursor
+            user_id,
+            self.request,
+            pages,
+            replies,
+            retweets,
+            wait_time,
+            cursor,
+            retain=retain,
+            lazy=lazy,
         )
 
-        # TODO : Find proper way to run the generator
-        results = [i for i in user_tweets.generator()]
+        for _ in user_tweets.generator(per_page=True):
+            pass
 
         return user_tweets
 
+    def get_tweets_many(
+        self,
+        usernames: Iterable[Union[str, int, User]],
+        pages: int = 1,
+        replies: bool = False,
+        retweets: bool = False,
+        wait_time: int = 2,
+        concurrency: int = 8,
+        retain: Union[bool, int] = True,
+        lazy: bool = False,
+    ):
+        """
+         Get the tweets of many users concurrently over the shared connection pool
+
+        :param: usernames: (`list[str | int | User]`) users whom to get the tweets of, duplicates are fetched once
+                           (usernames are matched case-insensitively)
+        :param: pages: (`int`) number of pages to be scraped for every user
+        :param: replies: (`boolean`) get the replied tweets of the users too
+        :param: retweets: (`boolean`) get the retweets of the users too
+        :param: wait_time: (`int`) seconds to wait between the pages of a single user
+        :param: concurrency: (`int`) number of timelines walked at the same time
+        :param: retain: (`boolean` | `int`) keep every Tweet on the result (`True`), only the current page (`False`)
+                        or the last `n` Tweets
+        :param: lazy: (`boolean`) return `LazyTweet` objects which only parse the fields that are read
+
+        :return: generator of (username, .types.usertweet.UserTweets) as soon as each user is done,
+                 the exception is given instead of the result if that user failed
+        """
+
+        def _get_tweets(username):
+            return self.get_tweets(
+                username,
+                pages,
+                replies,
+                retweets,
+                wait_time,
+                retain=retain,
+                lazy=lazy,
+            )
+
+        return _map_concurrent(
+            _get_tweets, _get_unique_usernames(usernames), concurrency
+        )
+
     def iter_tweets(
         self,
         username: Union[str, int, User],
@@ -132,6 +362,10 @@ class Twitter:
         retweets: bool = False,
         wait_time: int = 2,
         cursor: Optional[str] = None,
+        per_tweet: bool = False,
+        per_page: bool = False,
+        retain: Union[bool, int] = True,
+        lazy: bool = False,
     ):
         """
          Generator for getting the tweets from a user
@@ -141,17 +375,34 @@ class Twitter:
         :param: replies: (`boolean`) get the replied tweets of the user too
         :param: wait_time: (`int`) seconds to wait between multiple requests
         :param: cursor: Pagination cursor if you want to get the pages from that cursor up-to (This cursor is different from actual API cursor)
-
-        :return: (.types.usertweet.UserTweets, list[.types.twDataTypes.Tweet])
+        :param: per_tweet: (`boolean`) yield every Tweet as soon as it is parsed
+        :param: per_page: (`boolean`) yield one tuple for every page as soon as it is fetched
+                          instead of a single tuple with the Tweets of every page
+        :param: retain: (`boolean` | `int`) keep every Tweet on the result (`True`), only the current page (`False`)
+                        or the last `n` Tweets
+        :param: lazy: (`boolean`) return `LazyTweet` objects which only parse the fields that are read
+
+        :return: (.types.usertweet.UserTweets, list[.types.twDataTypes.Tweet]) once, for every page with `per_page`, or .types.twDataTypes.Tweet with `per_tweet`
         """
 
         user_id = self._get_user_id(username)
 
         user_tweets = UserTweets(
-            user_id, self.request, pages, replies, retweets, wait_time, cursor
+            user_id,
+            self.request,
+            pages,
+            replies,
+            retweets,
+            wait_time,
+            cursor,
+            retain=retain,
+            lazy=lazy,
         )
 
-        return user_tweets.generator()
+        if per_tweet:
+            return user_tweets.tweet_generator()
+
+        return user_tweets.generator(per_page)
 
     def get_trends(self):
         """
@@ -187,6 +438,8 @@ class Twitter:
         pages: int = 1,
         wait_time: int = 2,
         cursor: Optional[str] = None,
+        retain: Union[bool, int] = True,
+        lazy: bool = False,
     ):
         """
         Search for a keyword or hashtag on Twitter
@@ -196,17 +449,26 @@ class Twitter:
         :param search_filter: (`str`) The type of search to perform (live,user,photos,videos)
         :param wait_time : (`int`) seconds to wait between multiple requests
         :param cursor: (`str`) Pagination cursor if you want to get the pages from that cursor up-to (This cursor is different from actual API cursor)
+        :param retain: (`boolean` | `int`) keep every Tweet on the result (`True`) or only the last `n` Tweets
+        :param lazy: (`boolean`) return `LazyTweet` objects which only parse the fields that are read
 
 
         :return: (.types.searchtweet.SearchTweet, list[.types.twDataTypes.Tweet])
         """
 
         search_tweets = SearchTweets(
-            query, search_filter, self.request, pages, wait_time, cursor
+            query,
+            search_filter,
+            self.request,
+            pages,
+            wait_time,
+            cursor,
+            retain=retain,
+            lazy=lazy,
         )
 
-        # TODO : Find proper way to run the generator
-        results = [i for i in search_tweets.generator()]
+        for _ in search_tweets.generator(per_page=True):
+            pass
 
         return search_tweets
 
@@ -217,6 +479,10 @@ class Twitter:
         pages: int = 1,
         wait_time: int = 2,
         cursor: Optional[str] = None,
+        per_tweet: bool = False,
+        per_page: bool = False,
+        retain: Union[bool, int] = True,
+        lazy: bool = False,
     ):
         """
         Search for a keyword or hashtag on Twitter
@@ -226,16 +492,32 @@ class Twitter:
         :param search_filter: (`str`) The type of search to perform (Latest,user,photos,videos)
         :param wait_time : (`int`) seconds to wait between multiple requests
         :param cursor: (`str`) Pagination cursor if you want to get the pages from that cursor up-to (This cursor is different from actual API cursor)
+        :param per_tweet: (`boolean`) yield every Tweet as soon as it is parsed
+        :param per_page: (`boolean`) yield one tuple for every page as soon as it is fetched
+                         instead of a single tuple with the Tweets of every page
+        :param retain: (`boolean` | `int`) keep every Tweet on the result (`True`), only the current page (`False`)
+                       or the last `n` Tweets
+        :param lazy: (`boolean`) return `LazyTweet` objects which only parse the fields that are read
 
 
-        :return: list[.types.twDataTypes.Tweet]
+        :return: (.types.searchtweet.SearchTweets, list[.types.twDataTypes.Tweet]) once, for every page with `per_page`, or .types.twDataTypes.Tweet with `per_tweet`
         """
 
         search_tweets = SearchTweets(
-            query, search_filter, self.request, pages, wait_time, cursor
+            query,
+            search_filter,
+            self.request,
+            pages,
+            wait_time,
+            cursor,
+            retain=retain,
+            lazy=lazy,
         )
 
-        return search_tweets.generator()
+        if per_tweet:
+            return search_tweets.tweet_generator()
+
+        return search_tweets.generator(per_page)
 
     def tweet_detail(self, identifier: str):
         """
@@ -248,15 +530,489 @@ class Twitter:
 
         tweet_id = re.findall(r"\d+", identifier)[0]
 
-        r = self.request.get_tweet_detail(tweet_id)
+        r = self.conversations.get_detail(tweet_id)
+        details = self.conversations.get_related_details(r, tweet_id)
+        return _parse_tweet_detail(r, tweet_id, self.request, details)
 
-        try:
-            for entry in r["data"]["timeline_response"]["instructions"][0]["entries"]:
-                if str(entry["entryId"]).split("-")[0] == "tweet":
-                    raw_tweet = entry["content"]["content"]["tweetResult"]["result"]
+    def expand_conversation(
+        self,
+        identifier: str,
+        max_depth: Optional[int] = None,
+        max_tweets: Optional[int] = None,
+        concurrency: int = 8,
+    ):
+        """
+        Walk the replies of a tweet breadth-first, every level of replies being fetched concurrently
 
-                    if raw_tweet["rest_id"] == str(tweet_id):
-                        return Tweet(r, raw_tweet, self.request, True, False, True)
+        :param identifier: (`str`) The unique identifier of the tweet , either the `Tweet id` or `Tweet Link`
+        :param max_depth: (`int`) levels of replies to walk, all of them by default
+        :param max_tweets: (`int`) stop after this many replies
+        :param concurrency: (`int`) number of replies expanded at the same time
 
-        except KeyError:
-            raise InvalidTweetIdentifier(144, "StatusNotFound", r)
+        :return: generator of (depth, .types.twDataTypes.Tweet), the direct replies being at depth 1
+        """
+
+        tweet_id = re.findall(r"\d+", identifier)[0]
+        for depth, raw_tweet in self.conversations.expand(
+            tweet_id, max_depth, max_tweets, concurrency
+        ):
+            yield depth, Tweet(None, raw_tweet, self.request)
+
+    def iter_conversation(
+        self,
+        identifier: str,
+        max_depth: Optional[int] = None,
+        max_tweets: Optional[int] = None,
+        pages: Optional[int] = None,
+        wait_time: int = 2,
+    ):
+        """
+        Stream the replies of a tweet, following the cursors of its conversation page after page
+
+        :param identifier: (`str`) The unique identifier of the tweet , either the `Tweet id` or `Tweet Link`
+        :param max_depth: (`int`) leave out the replies nested deeper than this
+        :param max_tweets: (`int`) stop after this many replies
+        :param pages: (`int`) stop after this many pages, all of them by default
+        :param wait_time: (`int`) seconds to wait between two pages
+
+        :return: generator of (depth, .types.twDataTypes.Tweet), the direct replies being at depth 1
+        """
+
+        tweet_id = re.findall(r"\d+", identifier)[0]
+        for depth, raw_tweet in self.conversations.iter_conversation(
+            tweet_id, max_depth, max_tweets, pages, wait_time
+        ):
+            yield depth, Tweet(None, raw_tweet, self.request)
+
+
+class AsyncTwitter:
+    def __init__(
+        self,
+        max_retries: int = 10,
+        proxy: Optional[Union[dict, str, Proxy, list, ProxyPool]] = None,
+        max_connections: Optional[int] = None,
+        rate_limit: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        guest_tokens: int = 1,
+        http2: bool = False,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = 5.0,
+        cache: Optional[Union[ResponseCache, str]] = None,
+        user_ids: Optional[UserIdCache] = None,
+    ):
+        """
+        Constructor of the asyncio Twitter Public class, every method mirrors `Twitter` but has to be awaited
+
+        :param max_retries: (`int`) kept for compatibility, the guest token request is retried by `retry_policy`
+        :param proxy: (`dict`, `str` or `Proxy`) Provide the proxy you want to use while making a request.
+                      A `list` of proxies or a `ProxyPool` spreads the requests across all of them
+        :param max_connections: (`int`) Maximum number of connections opened to Twitter at the same time
+        :param rate_limit: (`bool`) pace the requests with the `x-rate-limit-*` headers sent by Twitter,
+                           which makes a `wait_time` of 0 safe when paginating
+        :param retry_policy: (`RetryPolicy`) how failed requests are retried, see `RequestMaker.stats` for the counts
+        :param guest_tokens: (`int`) number of guest tokens requests are spread across, kept warm in the background
+        :param http2: (`bool`) talk HTTP/2 to Twitter, multiplexing concurrent requests over one connection.
+                      Needs the `h2` package, i.e. `pip install httpx[http2]`
+        :param max_keepalive_connections: (`int`) idle connections kept open, defaults to `max_connections` or 20
+        :param keepalive_expiry: (`float`) seconds an idle connection is kept open, `None` keeps them forever
+        :param cache: (`ResponseCache` or `str`) keep the responses on disk and serve repeated requests from it,
+                      a `str` is the path of the SQLite database
+        :param user_ids: (`UserIdCache`) where the screen names are resolved to user ids, pass the same instance
+                         to several clients to share it. Every client gets its own in-memory one by default
+        """
+
+        self.request = AsyncRequestMaker(
+            max_retries=max_retries,
+            proxy=proxy,
+            max_connections=max_connections,
+            rate_limit=rate_limit,
+            retry_policy=retry_policy,
+            guest_tokens=guest_tokens,
+            http2=http2,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            cache=cache,
+        )
+        self.user_ids = UserIdCache() if user_ids is None else user_ids
+        self.conversations = AsyncConversationExpander(self.request)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the underlying connection pool
+        """
+
+        await self.request.aclose()
+
+    async def get_user_info(
+        self,
+        username: str,
+        banner_extensions: bool = False,
+        image_extensions: bool = False,
+    ):
+        """
+        Get the User Info of the specified username
+
+        :param username: (`str`) username to get information of
+        :param banner_extensions: (`boolean`) Get the Banner extension on the user page
+        :param image_extensions: (`boolean`) Get the Image extension on the user page
+
+        :return: .types.twDataTypes.User
+        """
+
+        user_raw = await self.request.get_user(username)
+        user = _parse_user(user_raw, banner_extensions, image_extensions)
+        self.user_ids.set(username, user.rest_id)
+        return user
+
+    def get_users(
+        self,
+        usernames: Iterable[str],
+        concurrency: int = 8,
+        banner_extensions: bool = False,
+        image_extensions: bool = False,
+    ):
+        """
+         Async generator for the User Info of many usernames, looked up concurrently over the shared connection pool
+
+        :param usernames: (`list[str]`) usernames to get information of, duplicates are looked up once
+        :param concurrency: (`int`) number of lookups made at the same time
+        :param banner_extensions: (`boolean`) Get the Banner extension on the user pages
+        :param image_extensions: (`boolean`) Get the Image extension on the user pages
+
+        :return: async generator of (username, .types.twDataTypes.User) as soon as each lookup is done,
+                 the exception (e.g. `UserNotFound`) is given instead of the User if that lookup failed
+        """
+
+        async def _get_user(username):
+            return await self.get_user_info(
+                username, banner_extensions, image_extensions
+            )
+
+        return _map_concurrent_async(
+            _get_user, _get_unique_usernames(usernames), concurrency
+        )
+
+    async def _get_user_id(
+        self,
+        username: Union[str, int, User],
+    ):
+        if isinstance(username, User):
+            user_id = username.rest_id
+        elif isinstance(username, int):
+            user_id = username
+        elif isinstance(username, str) and str(username).isdigit():
+            user_id = int(username)
+        else:
+            user_id = (
+                self.user_ids.get(username)
+                or (await self.get_user_info(username)).rest_id
+            )
+
+        return user_id
+
+    async def get_tweets(
+        self,
+        username: Union[str, int, User],
+        pages: int = 1,
+        replies: bool = False,
+        retweets: bool = False,
+        wait_time: int = 2,
+        cursor: Optional[str] = None,
+        retain: Union[bool, int] = True,
+        lazy: bool = False,
+    ):
+        """
+         Get the tweets from a user
+
+        :param: username: (`str` | `int` | `User`) username of the user whom to get the tweets of
+        :param: pages: (`int`) number of pages to be scraped
+        :param: replies: (`boolean`) get the replied tweets of the user too
+        :param: retweets: (`boolean`) get the retweets of the user too
+        :param: wait_time: (`int`) seconds to wait between multiple requests
+        :param: cursor: Pagination cursor if you want to get the pages
+                        from that cursor up-to (This cursor is different from actual API cursor)
+        :param: retain: (`boolean` | `int`) keep every Tweet on the result (`True`) or only the last `n` Tweets
+        :param: lazy: (`boolean`) return `LazyTweet` objects which only parse the fields that are read
+
+        :return: .types.usertweet.AsyncUserTweets
+        """
+        if wait_time is None:
+            wait_time = 0
+
+        user_id = await self._get_user_id(username)
+
+        user_tweets = AsyncUserTweets(
+            user_id,
+            self.request,
+            pages,
+            replies,
+            retweets,
+            wait_time,
+            cursor,
+            retain=retain,
+            lazy=lazy,
+        )
+
+        async for _ in user_tweets.generator(per_page=True):
+            pass
+
+        return user_tweets
+
+    def get_tweets_many(
+        self,
+        usernames: Iterable[Union[str, int, User]],
+        pages: int = 1,
+        replies: bool = False,
+        retweets: bool = False,
+        wait_time: int = 2,
+        concurrency: int = 8,
+        retain: Union[bool, int] = True,
+        lazy: bool = False,
+    ):
+        """
+         Async generator for the tweets of many users, fetched concurrently over the shared connection pool
+
+        :param: usernames: (`list[str | int | User]`) users whom to get the tweets of, duplicates are fetched once
+                           (usernames are matched case-insensitively)
+        :param: pages: (`int`) number of pages to be scraped for every user
+        :param: replies: (`boolean`) get the replied tweets of the users too
+        :param: retweets: (`boolean`) get the retweets of the users too
+        :param: wait_time: (`int`) seconds to wait between the pages of a single user
+        :param: concurrency: (`int`) number of timelines walked at the same time
+        :param: retain: (`boolean` | `int`) keep every Tweet on the result (`True`), only the current page (`False`)
+                        or the last `n` Tweets
+        :param: lazy: (`boolean`) return `LazyTweet` objects which only parse the fields that are read
+
+        :return: async generator of (username, .types.usertweet.AsyncUserTweets) as soon as each user is done,
+                 the exception is given instead of the result if that user failed
+        """
+
+        async def _get_tweets(username):
+            return await self.get_tweets(
+                username,
+                pages,
+                replies,
+                retweets,
+                wait_time,
+                retain=retain,
+                lazy=lazy,
+            )
+
+        return _map_concurrent_async(
+            _get_tweets, _get_unique_usernames(usernames), concurrency
+        )
+
+    async def iter_tweets(
+        self,
+        username: Union[str, int, User],
+        pages: int = 1,
+        replies: bool = False,
+        retweets: bool = False,
+        wait_time: int = 2,
+        cursor: Optional[str] = None,
+        per_tweet: bool = False,
+        per_page: bool = False,
+        retain: Union[bool, int] = True,
+        lazy: bool = False,
+    ):
+        """
+         Async generator for getting the tweets from a user
+
+        :param: username: (`str` | `int` | `User`) username of the user whom to get the tweets of
+        :param: pages: (`int`) number of pages to be scraped
+        :param: replies: (`boolean`) get the replied tweets of the user too
+        :param: wait_time: (`int`) seconds to wait between multiple requests
+        :param: cursor: Pagination cursor if you want to get the pages from that cursor up-to (This cursor is different from actual API cursor)
+        :param: per_tweet: (`boolean`) yield every Tweet as soon as it is parsed
+        :param: per_page: (`boolean`) yield one tuple for every page as soon as it is fetched
+                          instead of a single tuple with the Tweets of every page
+        :param: retain: (`boolean` | `int`) keep every Tweet on the result (`True`), only the current page (`False`)
+                        or the last `n` Tweets
+        :param: lazy: (`boolean`) return `LazyTweet` objects which only parse the fields that are read
+
+        :return: (.types.usertweet.AsyncUserTweets, list[.types.twDataTypes.Tweet]) once, for every page with `per_page`, or .types.twDataTypes.Tweet with `per_tweet`
+        """
+
+        user_id = await self._get_user_id(username)
+
+        user_tweets = AsyncUserTweets(
+            user_id,
+            self.request,
+            pages,
+            replies,
+            retweets,
+            wait_time,
+            cursor,
+            retain=retain,
+            lazy=lazy,
+        )
+
+        generator = (
+            user_tweets.tweet_generator()
+            if per_tweet
+            else user_tweets.generator(per_page)
+        )
+        async for result in generator:
+            yield result
+
+    async def search(
+        self,
+        query: str,
+        search_filter: SearchFilter = "live",
+        pages: int = 1,
+        wait_time: int = 2,
+        cursor: Optional[str] = None,
+        retain: Union[bool, int] = True,
+        lazy: bool = False,
+    ):
+        """
+        Search for a keyword or hashtag on Twitter
+
+        :param query: (`str`) The keyword which is supposed to be searched
+        :param pages: (`int`) The number of pages to get
+        :param search_filter: (`str`) The type of search to perform (live,user,photos,videos)
+        :param wait_time : (`int`) seconds to wait between multiple requests
+        :param cursor: (`str`) Pagination cursor if you want to get the pages from that cursor up-to (This cursor is different from actual API cursor)
+        :param retain: (`boolean` | `int`) keep every Tweet on the result (`True`) or only the last `n` Tweets
+        :param lazy: (`boolean`) return `LazyTweet` objects which only parse the fields that are read
+
+
+        :return: .types.searchtweet.AsyncSearchTweets
+        """
+
+        search_tweets = AsyncSearchTweets(
+            query,
+            search_filter,
+            self.request,
+            pages,
+            wait_time,
+            cursor,
+            retain=retain,
+            lazy=lazy,
+        )
+
+        async for _ in search_tweets.generator(per_page=True):
+            pass
+
+        return search_tweets
+
+    async def iter_search(
+        self,
+        query: str,
+        search_filter: SearchFilter = "live",
+        pages: int = 1,
+        wait_time: int = 2,
+        cursor: Optional[str] = None,
+        per_tweet: bool = False,
+        per_page: bool = False,
+        retain: Union[bool, int] = True,
+        lazy: bool = False,
+    ):
+        """
+        Async generator for searching a keyword or hashtag on Twitter
+
+        :param query: (`str`) The keyword which is supposed to be searched
+        :param pages: (`int`) The number of pages to get
+        :param search_filter: (`str`) The type of search to perform (Latest,user,photos,videos)
+        :param wait_time : (`int`) seconds to wait between multiple requests
+        :param cursor: (`str`) Pagination cursor if you want to get the pages from that cursor up-to (This cursor is different from actual API cursor)
+        :param per_tweet: (`boolean`) yield every Tweet as soon as it is parsed
+        :param per_page: (`boolean`) yield one tuple for every page as soon as it is fetched
+                         instead of a single tuple with the Tweets of every page
+        :param retain: (`boolean` | `int`) keep every Tweet on the result (`True`), only the current page (`False`)
+                       or the last `n` Tweets
+        :param lazy: (`boolean`) return `LazyTweet` objects which only parse the fields that are read
+
+
+        :return: (.types.searchtweet.AsyncSearchTweets, list[.types.twDataTypes.Tweet]) once, for every page with `per_page`, or .types.twDataTypes.Tweet with `per_tweet`
+        """
+
+        search_tweets = AsyncSearchTweets(
+            query,
+            search_filter,
+            self.request,
+            pages,
+            wait_time,
+            cursor,
+            retain=retain,
+            lazy=lazy,
+        )
+
+        generator = (
+            search_tweets.tweet_generator()
+            if per_tweet
+            else search_tweets.generator(per_page)
+        )
+        async for result in generator:
+            yield result
+
+    async def tweet_detail(self, identifier: str):
+        """
+        Get Detail of a single tweet
+
+        :param identifier: (`str`) The unique identifier of the tweet , either the `Tweet id` or `Tweet Link`
+
+        :return: .types.twDataTypes.Tweet
+        """
+
+        tweet_id = re.findall(r"\d+", identifier)[0]
+
+        r = await self.conversations.get_detail(tweet_id)
+        details = await self.conversations.get_related_details(r, tweet_id)
+        return _parse_tweet_detail(r, tweet_id, self.request, details)
+
+    async def expand_conversation(
+        self,
+        identifier: str,
+        max_depth: Optional[int] = None,
+        max_tweets: Optional[int] = None,
+        concurrency: int = 8,
+    ):
+        """
+        Async generator walking the replies of a tweet breadth-first, every level of replies being fetched concurrently
+
+        :param identifier: (`str`) The unique identifier of the tweet , either the `Tweet id` or `Tweet Link`
+        :param max_depth: (`int`) levels of replies to walk, all of them by default
+        :param max_tweets: (`int`) stop after this many replies
+        :param concurrency: (`int`) number of replies expanded at the same time
+
+        :return: async generator of (depth, .types.twDataTypes.Tweet), the direct replies being at depth 1
+        """
+
+        tweet_id = re.findall(r"\d+", identifier)[0]
+        async for depth, raw_tweet in self.conversations.expand(
+            tweet_id, max_depth, max_tweets, concurrency
+        ):
+            yield depth, Tweet(None, raw_tweet, self.request)
+
+    async def iter_conversation(
+        self,
+        identifier: str,
+        max_depth: Optional[int] = None,
+        max_tweets: Optional[int] = None,
+        pages: Optional[int] = None,
+        wait_time: int = 2,
+    ):
+        """
+        Async generator streaming the replies of a tweet, following the cursors of its conversation page after page
+
+        :param identifier: (`str`) The unique identifier of the tweet , either the `Tweet id` or `Tweet Link`
+        :param max_depth: (`int`) leave out the replies nested deeper than this
+        :param max_tweets: (`int`) stop after this many replies
+        :param pages: (`int`) stop after this many pages, all of them by default
+        :param wait_time: (`int`) seconds to wait between two pages
+
+        :return: async generator of (depth, .types.twDataTypes.Tweet), the direct replies being at depth 1
+        """
+
+        tweet_id = re.findall(r"\d+", identifier)[0]
+        async for depth, raw_tweet in self.conversations.iter_conversation(
+            tweet_id, max_depth, max_tweets, pages, wait_time
+        ):
+            yield depth, Tweet(None, raw_tweet, self.request)
@@ -0,0 +1,227 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class ResponseCache:
+    """
+    Persistent cache of API responses, backed by SQLite
+
+    Responses are keyed by method and url, which hold every parameter of the request; the headers
+    (guest token, csrf token...) are left out as they change between runs. Only successful responses
+    of `GET` requests to the endpoints listed in `ttls` are stored, each for its endpoint's TTL.
+    The database is opened in WAL mode, so several jobs can share one cache file.
+    """
+
+    # seconds a response stays fresh, matched against the url path
+    TTLS: Dict[str, float] = {
+        "UserResultByScreenNameQuery": 6 * 60 * 60,
+        "UserWithProfileTweets": 10 * 60,
+        "ConversationTimelineV2": 7 * 24 * 60 * 60,
+        "search/tweets.json": 5 * 60,
+        "guide.json": 5 * 60,
+    }
+
+    def __init__(
+        self,
+        path: str = "tweety-cache.sqlite",
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0,
+    ):
+        """
+        :param path: (`str`) the SQLite database, created if missing. `":memory:"` keeps the cache in process
+        :param ttls: (`dict[str, float]`) TTL per endpoint, merged over `TTLS`. A TTL of 0 disables caching
+        :param default_ttl: (`float`) TTL of the endpoints missing from `ttls`
+        """
+
+        self.path = path
+        self.ttls = {**self.TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self.__lock, self.__connection:
+            if path != ":memory:":
+                self.__connection.execute("PRAGMA journal_mode=WAL")
+
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, url TEXT, content BLOB, expires_at REAL)"
+            )
+
+    def get_ttl(self, url: str) -> float:
+        path = urlsplit(str(url)).path
+        for endpoint, ttl in self.ttls.items():
+            if endpoint in path:
+                return ttl
+
+        return self.default_ttl
+
+    @staticmethod
+    def get_key(method: str, url: str) -> str:
+        return hashlib.sha256(f"{method.upper()} {url}".encode()).hexdigest()
+
+    def get(self, method: str, url: str) -> Optional[bytes]:
+        """
+        Body of the cached response, `None` if there is no fresh one
+        """
+
+        if method.upper() != "GET" or self.get_ttl(url) <= 0:
+            return None
+
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT content, expires_at FROM responses WHERE key = ?",
+                (self.get_key(method, url),),
+            ).fetchone()
+
+        if row is None or row[1] < time.time():
+            return None
+
+        return row[0]
+
+    def set(self, method: str, url: str, content: bytes):
+        ttl = self.get_ttl(url)
+        if method.upper() != "GET" or ttl <= 0:
+            return
+
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (self.get_key(method, url), str(url), content, time.time() + ttl),
+            )
+
+    def purge(self) -> int:
+        """
+        Drop the expired responses
+
+        :return: number of responses dropped
+        """
+
+        with self.__lock, self.__connection:
+            return self.__connection.execute(
+                "DELETE FROM responses WHERE expires_at < ?", (time.time(),)
+            ).rowcount
+
+    def clear(self):
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM responses")
+
+    def close(self):
+        with self.__lock:
+            self.__connection.close()
+
+    def __len__(self):
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __repr__(self):
+        return f"ResponseCache(path={self.path!r}, responses={len(self)})"
+
+
+class UserIdCache:
+    """
+    Bounded LRU cache of screen name -> user id resolutions
+
+    Screen names are matched case-insensitively and every entry expires `ttl` seconds after being
+    resolved, as screen names can be changed and later taken by another account. Thread-safe, so a
+    single instance can be shared by several `Twitter` / `AsyncTwitter` instances. With a `path`
+    the entries are loaded from that JSON file on creation, and written back to it by `save`.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 24 * 60 * 60,
+        path: Optional[str] = None,
+    ):
+        """
+        :param max_size: (`int`) screen names kept, the least recently used ones are dropped first
+        :param ttl: (`float`) seconds a resolution stays valid
+        :param path: (`str`) JSON file the cache is loaded from and saved to
+        """
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        self.__entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.__lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    @staticmethod
+    def get_key(username: str) -> str:
+        return username.lstrip("@").lower()
+
+    def get(self, username: str) -> Optional[str]:
+        key = self.get_key(username)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+
+            if entry[1] < time.time():
+                del self.__entries[key]
+                return None
+
+            self.__entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, username: str, user_id: str, expires_at: Optional[float] = None):
+        key = self.get_key(username)
+        with self.__lock:
+            self.__entries[key] = (str(user_id), expires_at or time.time() + self.ttl)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def discard(self, username: str):
+        with self.__lock:
+            self.__entries.pop(self.get_key(username), None)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def load(self, path: Optional[str] = None):
+        """
+        Add the entries saved in `path` which haven't expired yet
+        """
+
+        with open(path or self.path, encoding="utf-8") as f:
+            entries = json.load(f)
+
+        now = time.time()
+        for username, (user_id, expires_at) in entries.items():
+            if expires_at > now:
+                self.set(username, user_id, expires_at)
+
+    def save(self, path: Optional[str] = None):
+        """
+        Write the entries to `path`, `self.path` by default
+        """
+
+        path = path or self.path
+        if not path:
+            raise ValueError("UserIdCache.save needs a path")
+
+        with self.__lock:
+            entries = dict(self.__entries)
+
+        temp = f"{path}.tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+
+        os.replace(temp, path)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __repr__(self):
+        return f"UserIdCache(size={len(self)}, max_size={self.max_size})"
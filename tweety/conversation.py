@@ -0,0 +1,406 @@
+"""
+Breadth-first expansion of conversations out of `ConversationTimelineV2` (`tweet_detail`) responses.
+Every level of the reply tree is fetched concurrently, so a walk costs about one round-trip per depth
+level; tweet ids are deduplicated across the walk, so each response is fetched once per walk. Nothing is
+kept between walks, persistent caching is left to `tweety.cache.ResponseCache`.
+`iter_conversation` instead pages through the single conversation of a tweet, cursor after cursor.
+"""
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+# cursors leading to more replies: the next page, and the rest of a collapsed thread module
+REPLY_CURSOR_TYPES = ("Bottom", "ShowMore", "ShowMoreThreads", "ShowMoreThreadsPrompt")
+
+
+def get_conversation_entries(response: Any) -> list:
+    try:
+        instructions = response["data"]["timeline_response"]["instructions"]
+    except (KeyError, TypeError):
+        return []
+
+    entries = []
+    for instruction in instructions:
+        entries.extend(instruction.get("entries") or [])
+        if instruction.get("moduleItems"):
+            # "show more" pages add their replies to a thread module of an earlier page
+            entries.append(
+                {
+                    "entryId": instruction.get("moduleEntryId", "conversationthread"),
+                    "content": {"items": instruction["moduleItems"]},
+                }
+            )
+
+    return entries
+
+
+def _get_entry_kind(entry: dict) -> str:
+    return str(entry.get("entryId", "")).split("-")[0]
+
+
+def _get_content_tweet(content: dict) -> Optional[dict]:
+    content = content.get("itemContent") or content.get("content") or {}
+    result = content.get("tweet_results") or content.get("tweetResult") or {}
+    return result.get("result")
+
+
+def get_tweet_id(raw_tweet: dict) -> Optional[str]:
+    rest_id = raw_tweet.get("rest_id") or raw_tweet.get("tweet", {}).get("rest_id")
+    return None if rest_id is None else str(rest_id)
+
+
+def get_parent_id(raw_tweet: dict) -> Optional[str]:
+    """
+    Id of the tweet `raw_tweet` replies to
+    """
+
+    tweet = raw_tweet.get("tweet") or raw_tweet
+    legacy = tweet.get("legacy") or tweet
+    return legacy.get("in_reply_to_status_id_str")
+
+
+def _get_content_cursor(content: dict) -> Tuple[Optional[str], Optional[str]]:
+    content = content.get("itemContent") or content.get("content") or content
+    return content.get("cursorType"), content.get("value")
+
+
+def get_conversation_cursors(response: Any) -> List[Tuple[str, str]]:
+    """
+    (cursor type, cursor) of every cursor of a `tweet_detail` response, thread modules included
+    """
+
+    cursors = []
+    for entry in get_conversation_entries(response):
+        kind = _get_entry_kind(entry)
+        if kind == "cursor":
+            cursors.append(_get_content_cursor(entry.get("content", {})))
+        elif kind == "conversationthread":
+            for item in entry.get("content", {}).get("items", []):
+                cursors.append(_get_content_cursor(item.get("item", {})))
+
+    return [(kind, value) for kind, value in cursors if kind and value]
+
+
+def get_conversation_tweets(response: Any) -> Iterator[dict]:
+    """
+    Raw tweets of the standalone entries of a `tweet_detail` response: the focal tweet and the ones above it
+    """
+
+    for entry in get_conversation_entries(response):
+        if _get_entry_kind(entry) == "tweet":
+            raw_tweet = _get_content_tweet(entry.get("content", {}))
+            if raw_tweet:
+                yield raw_tweet
+
+
+def get_conversation_replies(response: Any) -> Iterator[Tuple[str, dict]]:
+    """
+    (display type, raw tweet) of the replies of a `tweet_detail` response. The display type is
+    `"SelfThread"` for the replies the author made to their own tweet
+    """
+
+    for entry in get_conversation_entries(response):
+        if _get_entry_kind(entry) != "conversationthread":
+            continue
+
+        for item in entry.get("content", {}).get("items", []):
+            content = item.get("item", {})
+            raw_tweet = _get_content_tweet(content)
+            if raw_tweet:
+                item_content = content.get("itemContent") or content.get("content")
+                yield (item_content or {}).get("tweetDisplayType", "Tweet"), raw_tweet
+
+
+def _get_parent_ids(response: Any, tweet_id: Union[str, int]) -> List[str]:
+    return [
+        get_parent_id(raw_tweet)
+        for raw_tweet in get_conversation_tweets(response)
+        if get_tweet_id(raw_tweet) == str(tweet_id) and get_parent_id(raw_tweet)
+    ]
+
+
+def _get_new_replies(
+    response: Any, parent_id: str, depths: Dict[str, int], max_depth: Optional[int]
+) -> Iterator[Tuple[int, dict]]:
+    # replies not seen yet in the walk, `depths` gets every one of them
+    for _, raw_tweet in get_conversation_replies(response):
+        reply_id = get_tweet_id(raw_tweet)
+        if reply_id is None or reply_id in depths:
+            continue
+
+        # the replies further down a thread module hang off the reply above them
+        reply_depth = depths.get(get_parent_id(raw_tweet), depths[parent_id]) + 1
+        # kept even when too deep, so the replies below it are too
+        depths[reply_id] = reply_depth
+        if max_depth is None or reply_depth <= max_depth:
+            yield reply_depth, raw_tweet
+
+
+def _get_new_cursors(response: Any, seen: set) -> List[str]:
+    cursors = []
+    for kind, cursor in get_conversation_cursors(response):
+        if kind in REPLY_CURSOR_TYPES and cursor not in seen:
+            seen.add(cursor)
+            cursors.append(cursor)
+
+    return cursors
+
+
+class ConversationExpander:
+    """
+    Fetches `tweet_detail` responses concurrently and walks reply trees breadth-first
+
+    :param http: the `RequestMaker` the responses are fetched with
+    :param concurrency: (`int`) number of responses fetched at the same time
+    """
+
+    def __init__(self, http, concurrency: int = 8):
+        self.http = http
+        self.concurrency = max(int(concurrency), 1)
+
+    def get_detail(self, tweet_id: Union[str, int]) -> Any:
+        return self.http.get_tweet_detail(str(tweet_id))
+
+    def get_details(
+        self, tweet_ids: Iterable, concurrency: Optional[int] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        (tweet id, response) of every tweet as soon as it is fetched, the exception is given instead
+        of the response if that request failed
+        """
+
+        concurrency = concurrency or self.concurrency
+        tweet_ids = list(dict.fromkeys(str(i) for i in tweet_ids))
+        if len(tweet_ids) == 1:
+            try:
+                yield tweet_ids[0], self.get_detail(tweet_ids[0])
+            except Exception as error:
+                yield tweet_ids[0], error
+            return
+
+        with ThreadPoolExecutor(min(concurrency, len(tweet_ids))) as executor:
+            futures = {executor.submit(self.get_detail, i): i for i in tweet_ids}
+            for future in as_completed(futures):
+                yield futures[future], future.exception() or future.result()
+
+    def get_related_details(
+        self, response: Any, tweet_id: Union[str, int]
+    ) -> Dict[str, Any]:
+        """
+        Responses a `Tweet` built with `get_threads` / `get_reply` out of `response` asks for,
+        so it doesn't have to fetch them one after another from its constructor
+        """
+
+        details = {str(tweet_id): response}
+        for parent_id in _get_parent_ids(response, tweet_id):
+            if parent_id not in details:
+                details[parent_id] = self.get_detail(parent_id)
+
+        return details
+
+    def expand(
+        self,
+        tweet_id: Union[str, int],
+        max_depth: Optional[int] = None,
+        max_tweets: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> Iterator[Tuple[int, dict]]:
+        """
+        Walk the replies of `tweet_id` breadth-first
+
+        Every reply of a level is expanded with one concurrent batch of requests. A reply whose
+        response can't be fetched is still yielded, only its own replies are left out.
+
+        :param tweet_id: (`str`) the tweet the walk starts from
+        :param max_depth: (`int`) levels of replies to walk, all of them by default
+        :param max_tweets: (`int`) stop after this many replies
+        :param concurrency: (`int`) responses fetched at the same time, `self.concurrency` by default
+
+        :return: generator of (depth, raw tweet), the direct replies of `tweet_id` being at depth 1
+        """
+
+        tweet_id = str(tweet_id)
+        # the tweet itself is fetched on its own, so the walk fails right away if it can't be
+        responses = [(tweet_id, self.get_detail(tweet_id))]
+        depths = {tweet_id: 0}
+        count = 0
+        depth = 0
+        while responses:
+            next_level = []
+            for parent_id, response in responses:
+                if isinstance(response, Exception):
+                    continue
+
+                for reply_depth, raw_tweet in _get_new_replies(
+                    response, parent_id, depths, max_depth
+                ):
+                    next_level.append(get_tweet_id(raw_tweet))
+                    yield reply_depth, raw_tweet
+
+                    count += 1
+                    if max_tweets is not None and count >= max_tweets:
+                        return
+
+            depth += 1
+            if not next_level or (max_depth is not None and depth >= max_depth):
+                return
+
+            responses = self.get_details(next_level, concurrency)
+
+    def iter_conversation(
+        self,
+        tweet_id: Union[str, int],
+        max_depth: Optional[int] = None,
+        max_tweets: Optional[int] = None,
+        pages: Optional[int] = None,
+        wait_time: float = 0,
+    ) -> Iterator[Tuple[int, dict]]:
+        """
+        Stream the replies of `tweet_id` out of its own conversation timeline, following its cursors
+
+        Unlike `expand`, which fetches the timeline of every reply, this pages through the
+        single conversation of `tweet_id`: the next pages and the collapsed thread modules.
+        Only the ids of the replies seen so far are held on to, not the replies themselves.
+
+        :param tweet_id: (`str`) the tweet whose replies are crawled
+        :param max_depth: (`int`) leave out the replies nested deeper than this
+        :param max_tweets: (`int`) stop after this many replies
+        :param pages: (`int`) stop after this many responses, all of them by default
+        :param wait_time: (`float`) seconds to wait between two responses
+
+        :return: generator of (depth, raw tweet), the direct replies of `tweet_id` being at depth 1
+        """
+
+        tweet_id = str(tweet_id)
+        depths = {tweet_id: 0}
+        cursors = deque([None])
+        seen_cursors = set()
+        count = 0
+        page = 0
+        while cursors and (pages is None or page < pages):
+            cursor = cursors.popleft()
+            if cursor is None:
+                response = self.get_detail(tweet_id)
+            else:
+                response = self.http.get_tweet_detail(tweet_id, cursor)
+
+            page += 1
+            for reply_depth, raw_tweet in _get_new_replies(
+                response, tweet_id, depths, max_depth
+            ):
+                yield reply_depth, raw_tweet
+
+                count += 1
+                if max_tweets is not None and count >= max_tweets:
+                    return
+
+            cursors.extend(_get_new_cursors(response, seen_cursors))
+            if cursors and wait_time:
+                time.sleep(wait_time)
+
+
+class AsyncConversationExpander(ConversationExpander):
+    """
+    `asyncio` counterpart of `ConversationExpander`, for an `AsyncRequestMaker`
+    """
+
+    async def get_detail(self, tweet_id: Union[str, int]) -> Any:
+        return await self.http.get_tweet_detail(str(tweet_id))
+
+    async def get_details(
+        self, tweet_ids: Iterable, concurrency: Optional[int] = None
+    ) -> List[Tuple[str, Any]]:
+        tweet_ids = list(dict.fromkeys(str(i) for i in tweet_ids))
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def fetch(tweet_id):
+            async with semaphore:
+                try:
+                    return tweet_id, await self.get_detail(tweet_id)
+                except Exception as error:
+                    return tweet_id, error
+
+        return await asyncio.gather(*(fetch(i) for i in tweet_ids))
+
+    async def get_related_details(
+        self, response: Any, tweet_id: Union[str, int]
+    ) -> Dict[str, Any]:
+        details = {str(tweet_id): response}
+        for parent_id in _get_parent_ids(response, tweet_id):
+            if parent_id not in details:
+                details[parent_id] = await self.get_detail(parent_id)
+
+        return details
+
+    async def expand(
+        self,
+        tweet_id: Union[str, int],
+        max_depth: Optional[int] = None,
+        max_tweets: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ):
+        tweet_id = str(tweet_id)
+        # the tweet itself is fetched on its own, so the walk fails right away if it can't be
+        responses = [(tweet_id, await self.get_detail(tweet_id))]
+        depths = {tweet_id: 0}
+        count = 0
+        depth = 0
+        while responses:
+            next_level = []
+            for parent_id, response in responses:
+                if isinstance(response, Exception):
+                    continue
+
+                for reply_depth, raw_tweet in _get_new_replies(
+                    response, parent_id, depths, max_depth
+                ):
+                    next_level.append(get_tweet_id(raw_tweet))
+                    yield reply_depth, raw_tweet
+
+                    count += 1
+                    if max_tweets is not None and count >= max_tweets:
+                        return
+
+            depth += 1
+            if not next_level or (max_depth is not None and depth >= max_depth):
+                return
+
+            responses = await self.get_details(next_level, concurrency)
+
+    async def iter_conversation(
+        self,
+        tweet_id: Union[str, int],
+        max_depth: Optional[int] = None,
+        max_tweets: Optional[int] = None,
+        pages: Optional[int] = None,
+        wait_time: float = 0,
+    ):
+        tweet_id = str(tweet_id)
+        depths = {tweet_id: 0}
+        cursors = deque([None])
+        seen_cursors = set()
+        count = 0
+        page = 0
+        while cursors and (pages is None or page < pages):
+            cursor = cursors.popleft()
+            if cursor is None:
+                response = await self.get_detail(tweet_id)
+            else:
+                response = await self.http.get_tweet_detail(tweet_id, cursor)
+
+            page += 1
+            for reply_depth, raw_tweet in _get_new_replies(
+                response, tweet_id, depths, max_depth
+            ):
+                yield reply_depth, raw_tweet
+
+                count += 1
+                if max_tweets is not None and count >= max_tweets:
+                    return
+
+            cursors.extend(_get_new_cursors(response, seen_cursors))
+            if cursors and wait_time:
+                await asyncio.sleep(wait_time)
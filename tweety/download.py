@@ -0,0 +1,577 @@
+"""
+Segmented media downloads: the file is split in byte ranges fetched in parallel into a `.part` file,
+whose progress is kept in a `.part.json` sidecar so an interrupted download picks up where it stopped.
+The `.part` file only replaces the target once every segment is complete.
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import httpx as s
+from tqdm import tqdm
+
+from .types.n_types import StreamPolicy, check_stream_policy
+
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 1024 * 1024
+MIN_SEGMENT_SIZE = 1024 * 1024
+# flush the sidecar after this many bytes, an interruption costs at most that much per segment
+SAVE_EVERY = 4 * 1024 * 1024
+
+
+class RangeNotSupported(Exception):
+    """
+    The server ignored the `Range` header, or the file changed since the download started
+    """
+
+
+def get_chunk_size(size: Optional[int], segments: int = 1) -> int:
+    """
+    Read size for a download, bigger files get bigger chunks
+    """
+
+    if not size:
+        return MIN_CHUNK_SIZE
+
+    return min(max(size // (segments * 64), MIN_CHUNK_SIZE), MAX_CHUNK_SIZE)
+
+
+class DownloadState:
+    """
+    Byte ranges of a download and how much of each one is already on disk
+    """
+
+    def __init__(self, url: str, size: int, etag: Optional[str], segments: List[list]):
+        self.url = url
+        self.size = size
+        self.etag = etag
+        # [start, end (inclusive), downloaded bytes]
+        self.segments = segments
+        self.__lock = threading.Lock()
+        self.__save_lock = threading.Lock()
+        self.__unsaved = 0
+
+    @classmethod
+    def new(
+        cls,
+        url: str,
+        size: int,
+        etag: Optional[str] = None,
+        segments: int = 4,
+        min_segment_size: int = MIN_SEGMENT_SIZE,
+    ):
+        count = max(min(segments, size // max(min_segment_size, 1)), 1)
+        step = -(-size // count)
+        return cls(
+            url,
+            size,
+            etag,
+            [[start, min(start + step, size) - 1, 0] for start in range(0, size, step)],
+        )
+
+    @classmethod
+    def load(cls, path: str, url: str, size: int, etag: Optional[str] = None):
+        """
+        The saved state of `path`, `None` if there is none or it belongs to another file
+        """
+
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get("url") != url or data.get("size") != size:
+            return None
+
+        if etag and data.get("etag") and data["etag"] != etag:
+            return None
+
+        return cls(url, size, data.get("etag"), data.get("segments") or [])
+
+    def save(self, path: str):
+        with self.__save_lock:
+            with self.__lock:
+                data = dict(
+                    url=self.url,
+                    size=self.size,
+                    etag=self.etag,
+                    segments=[list(i) for i in self.segments],
+                )
+                self.__unsaved = 0
+
+            with open(f"{path}.tmp", "w") as f:
+                json.dump(data, f)
+
+            os.replace(f"{path}.tmp", path)
+
+    def advance(self, segment: list, length: int) -> bool:
+        """
+        Record `length` more bytes of `segment`, `True` when the state is due to be saved
+        """
+
+        with self.__lock:
+            segment[2] += length
+            self.__unsaved += length
+            return self.__unsaved >= SAVE_EVERY
+
+    @property
+    def downloaded(self) -> int:
+        return sum(segment[2] for segment in self.segments)
+
+    @property
+    def pending(self) -> List[list]:
+        return [i for i in self.segments if i[0] + i[2] <= i[1]]
+
+
+def _get_filenames(filename: str):
+    part = f"{filename}.part"
+    return part, f"{part}.json"
+
+
+def _prepare(
+    filename: str,
+    url: str,
+    size: int,
+    etag: Optional[str],
+    segments: int,
+    min_segment_size: int,
+) -> DownloadState:
+    part, sidecar = _get_filenames(filename)
+    state = DownloadState.load(sidecar, url, size, etag)
+    if state is None or not os.path.exists(part) or os.path.getsize(part) != size:
+        state = DownloadState.new(url, size, etag, segments, min_segment_size)
+        with open(part, "wb") as f:
+            f.truncate(size)
+
+        state.save(sidecar)
+
+    return state
+
+
+def _finish(filename: str):
+    part, sidecar = _get_filenames(filename)
+    os.replace(part, filename)
+    if os.path.exists(sidecar):
+        os.remove(sidecar)
+
+
+def _is_downloaded(filename: str, size: Optional[int]) -> bool:
+    return bool(size) and os.path.isfile(filename) and os.path.getsize(filename) == size
+
+
+def _get_range_headers(state: DownloadState, segment: list) -> dict:
+    headers = {"Range": f"bytes={segment[0] + segment[2]}-{segment[1]}"}
+    if state.etag:
+        # a changed file comes back whole instead of as a mismatched range
+        headers["If-Range"] = state.etag
+
+    return headers
+
+
+def _get_probe(response: s.Response):
+    size = response.headers.get("Content-Length")
+    ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+    etag = response.headers.get("ETag")
+    if etag and etag.startswith("W/"):
+        # weak validators can't be used with If-Range
+        etag = None
+
+    return (int(size) if size and size.isdigit() else None), ranges, etag
+
+
+class ChunkedDownloader:
+    """
+    Downloads a file over parallel `Range` requests, resuming any `.part` file left behind
+    by an earlier attempt. Servers without range support get a plain sequential download.
+    """
+
+    def __init__(
+        self,
+        session: s.Client,
+        segments: int = 4,
+        min_segment_size: int = MIN_SEGMENT_SIZE,
+    ):
+        """
+        :param session: (`httpx.Client`) the client to download with
+        :param segments: (`int`) maximum number of ranges fetched at the same time
+        :param min_segment_size: (`int`) files are never split in ranges smaller than this many bytes
+        """
+
+        self.session = session
+        self.segments = max(int(segments), 1)
+        self.min_segment_size = min_segment_size
+
+    def download(
+        self,
+        url: str,
+        filename: str,
+        show_progress: bool = True,
+        skip_existing: bool = False,
+    ) -> str:
+        response = self.session.head(url, follow_redirects=True)
+        size, ranges, etag = (
+            _get_probe(response) if response.is_success else (None, False, None)
+        )
+        if skip_existing and _is_downloaded(filename, size):
+            return filename
+
+        if size and ranges:
+            try:
+                self._download_segments(url, filename, size, etag, show_progress)
+                return filename
+            except RangeNotSupported:
+                pass
+
+        self._download_sequential(url, filename, show_progress)
+        return filename
+
+    def _download_segments(self, url, filename, size, etag, show_progress):
+        state = _prepare(
+            filename, url, size, etag, self.segments, self.min_segment_size
+        )
+        part, sidecar = _get_filenames(filename)
+        chunk_size = get_chunk_size(size, len(state.segments))
+
+        with tqdm(
+            total=size,
+            initial=state.downloaded,
+            unit="B",
+            unit_scale=True,
+            desc=f"[{filename}]",
+            disable=not show_progress,
+        ) as pbar:
+
+            def fetch(segment):
+                with open(part, "r+b") as f, self.session.stream(
+                    "GET",
+                    url,
+                    headers=_get_range_headers(state, segment),
+                    follow_redirects=True,
+                ) as response:
+                    if response.status_code != 206:
+                        response.raise_for_status()
+                        raise RangeNotSupported(url)
+
+                    f.seek(segment[0] + segment[2])
+                    for chunk in response.iter_bytes(chunk_size=chunk_size):
+                        chunk = chunk[: segment[1] + 1 - segment[0] - segment[2]]
+                        f.write(chunk)
+                        pbar.update(len(chunk))
+                        if state.advance(segment, len(chunk)):
+                            f.flush()
+                            state.save(sidecar)
+
+            try:
+                with ThreadPoolExecutor(self.segments) as executor:
+                    for _ in executor.map(fetch, state.pending):
+                        pass
+            finally:
+                state.save(sidecar)
+
+        if state.pending:
+            raise s.ReadError(f"Incomplete download of {url}")
+
+        _finish(filename)
+
+    def _download_sequential(self, url, filename, show_progress):
+        part, sidecar = _get_filenames(filename)
+        with self.session.stream("GET", url, follow_redirects=True) as response:
+            response.raise_for_status()
+            size, _, _ = _get_probe(response)
+            with open(part, "wb") as f, tqdm(
+                total=size,
+                unit="B",
+                unit_scale=True,
+                desc=f"[{filename}]",
+                disable=not show_progress,
+            ) as pbar:
+                for chunk in response.iter_bytes(chunk_size=get_chunk_size(size)):
+                    f.write(chunk)
+                    pbar.update(len(chunk))
+
+        _finish(filename)
+
+
+class AsyncChunkedDownloader(ChunkedDownloader):
+    """
+    `asyncio` counterpart of `ChunkedDownloader`, backed by `httpx.AsyncClient`
+    """
+
+    async def download(
+        self,
+        url: str,
+        filename: str,
+        show_progress: bool = True,
+        skip_existing: bool = False,
+    ):
+        response = await self.session.head(url, follow_redirects=True)
+        size, ranges, etag = (
+            _get_probe(response) if response.is_success else (None, False, None)
+        )
+        if skip_existing and _is_downloaded(filename, size):
+            return filename
+
+        if size and ranges:
+            try:
+                await self._download_segments(url, filename, size, etag, show_progress)
+                return filename
+            except RangeNotSupported:
+                pass
+
+        await self._download_sequential(url, filename, show_progress)
+        return filename
+
+    async def _download_segments(self, url, filename, size, etag, show_progress):
+        state = _prepare(
+            filename, url, size, etag, self.segments, self.min_segment_size
+        )
+        part, sidecar = _get_filenames(filename)
+        chunk_size = get_chunk_size(size, len(state.segments))
+        semaphore = asyncio.Semaphore(self.segments)
+
+        with tqdm(
+            total=size,
+            initial=state.downloaded,
+            unit="B",
+            unit_scale=True,
+            desc=f"[{filename}]",
+            disable=not show_progress,
+        ) as pbar:
+
+            async def fetch(segment):
+                async with semaphore:
+                    with open(part, "r+b") as f:
+                        async with self.session.stream(
+                            "GET",
+                            url,
+                            headers=_get_range_headers(state, segment),
+                            follow_redirects=True,
+                        ) as response:
+                            if response.status_code != 206:
+                                response.raise_for_status()
+                                raise RangeNotSupported(url)
+
+                            f.seek(segment[0] + segment[2])
+                            async for chunk in response.aiter_bytes(
+                                chunk_size=chunk_size
+                            ):
+                                chunk = chunk[: segment[1] + 1 - segment[0] - segment[2]]
+                                f.write(chunk)
+                                pbar.update(len(chunk))
+                                if state.advance(segment, len(chunk)):
+                                    f.flush()
+                                    state.save(sidecar)
+
+            try:
+                await asyncio.gather(*(fetch(segment) for segment in state.pending))
+            finally:
+                state.save(sidecar)
+
+        if state.pending:
+            raise s.ReadError(f"Incomplete download of {url}")
+
+        _finish(filename)
+
+    async def _download_sequential(self, url, filename, show_progress):
+        part, sidecar = _get_filenames(filename)
+        async with self.session.stream("GET", url, follow_redirects=True) as response:
+            response.raise_for_status()
+            size, _, _ = _get_probe(response)
+            with open(part, "wb") as f, tqdm(
+                total=size,
+                unit="B",
+                unit_scale=True,
+                desc=f"[{filename}]",
+                disable=not show_progress,
+            ) as pbar:
+                async for chunk in response.aiter_bytes(
+                    chunk_size=get_chunk_size(size)
+                ):
+                    f.write(chunk)
+                    pbar.update(len(chunk))
+
+        _finish(filename)
+
+
+class DownloadReport:
+    """
+    Outcome of `download_all`: what got downloaded, skipped or failed and how fast
+    """
+
+    def __init__(self):
+        self.downloaded: List[str] = []
+        self.skipped: List[str] = []
+        self.failed: Dict[str, BaseException] = {}
+        self.bytes = 0
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """
+        Downloaded bytes per second
+        """
+
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def _add(self, filename: str, mtime: Optional[int]):
+        if mtime is not None and _get_mtime(filename) == mtime:
+            self.skipped.append(filename)
+            return
+
+        self.downloaded.append(filename)
+        self.bytes += os.path.getsize(filename)
+
+    def _finish(self):
+        self.elapsed = time.perf_counter() - self.started
+        return self
+
+    def __repr__(self):
+        return (
+            f"DownloadReport(downloaded={len(self.downloaded)}, skipped={len(self.skipped)}, "
+            f"failed={len(self.failed)}, bytes={self.bytes}, throughput={self.throughput / 1e6:.2f}MB/s)"
+        )
+
+
+def _get_mtime(filename: str) -> Optional[int]:
+    try:
+        return os.stat(filename).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_unique_media(
+    tweets: Iterable[Any],
+    policy: StreamPolicy = "max-res",
+    target: Optional[Union[int, Tuple[int, int]]] = None,
+    max_bytes: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Every downloadable `Media` of `tweets`, keyed by `media_key` so media shared by several tweets
+    (retweets, quotes, reposted threads) is only fetched once. Media pointing at the same url is dropped too,
+    as it would be saved to the same file
+
+    :return: `dict` of `media_key` to (`Media`, url to download)
+    """
+
+    media, urls = {}, set()
+    for tweet in tweets:
+        for item in getattr(tweet, "media", None) or []:
+            url = item.get_download_url(policy, target, max_bytes)
+            key = item.media_key or item.id or url
+            if url and key not in media and url not in urls:
+                media[key] = (item, url)
+                urls.add(url)
+
+    return media
+
+
+def _get_media_filename(directory: str, url: str) -> str:
+    return os.path.join(directory, os.path.basename(url).split("?")[0])
+
+
+def download_all(
+    tweets: Iterable[Any],
+    http,
+    directory: str = ".",
+    concurrency: int = 8,
+    segments: int = 4,
+    skip_existing: bool = True,
+    show_progress: bool = True,
+    policy: StreamPolicy = "max-res",
+    target: Optional[Union[int, Tuple[int, int]]] = None,
+    max_bytes: Optional[int] = None,
+) -> DownloadReport:
+    """
+    Download the media of a whole result set (`UserTweets`, `SearchTweets` or any iterable of `Tweet`)
+
+    :param tweets: the tweets to take the media from
+    :param http: (`RequestMaker`) the request maker of the result set
+    :param directory: (`str`) where to save the files, created if missing
+    :param concurrency: (`int`) files downloaded at the same time
+    :param segments: (`int`) range requests per file, see `ChunkedDownloader`
+    :param skip_existing: (`bool`) leave files already on disk with the right size alone
+    :param show_progress: (`bool`) show one progress bar for the whole batch
+    :param policy: (`str`) which video variant to download, see `Media.best_stream`
+    :param target: (`int` | `tuple[int, int]`) height or (width, height) for the `closest` policy
+    :param max_bytes: (`int`) size limit of a single video for the `budget` policy
+
+    :return: `DownloadReport`
+    """
+
+    check_stream_policy(policy, target, max_bytes)
+    os.makedirs(directory, exist_ok=True)
+    media = get_unique_media(tweets, policy, target, max_bytes)
+    report = DownloadReport()
+
+    def fetch(url):
+        filename = _get_media_filename(directory, url)
+        mtime = _get_mtime(filename)
+        http.download_media(url, filename, False, segments, skip_existing)
+        return filename, mtime
+
+    with ThreadPoolExecutor(max(int(concurrency), 1)) as executor, tqdm(
+        total=len(media), unit="file", disable=not show_progress
+    ) as pbar:
+        futures = {
+            executor.submit(fetch, url): key for key, (_, url) in media.items()
+        }
+        for future in as_completed(futures):
+            try:
+                report._add(*future.result())
+            except Exception as error:
+                report.failed[futures[future]] = error
+
+            pbar.update(1)
+            pbar.set_postfix_str(f"{report.bytes / 1e6:.1f}MB")
+
+    return report._finish()
+
+
+async def download_all_async(
+    tweets: Iterable[Any],
+    http,
+    directory: str = ".",
+    concurrency: int = 8,
+    segments: int = 4,
+    skip_existing: bool = True,
+    show_progress: bool = True,
+    policy: StreamPolicy = "max-res",
+    target: Optional[Union[int, Tuple[int, int]]] = None,
+    max_bytes: Optional[int] = None,
+) -> DownloadReport:
+    """
+    `asyncio` counterpart of `download_all`, `http` being an `AsyncRequestMaker`
+    """
+
+    check_stream_policy(policy, target, max_bytes)
+    os.makedirs(directory, exist_ok=True)
+    media = get_unique_media(tweets, policy, target, max_bytes)
+    report = DownloadReport()
+    semaphore = asyncio.Semaphore(max(int(concurrency), 1))
+
+    with tqdm(total=len(media), unit="file", disable=not show_progress) as pbar:
+
+        async def fetch(key, url):
+            filename = _get_media_filename(directory, url)
+            async with semaphore:
+                try:
+                    mtime = _get_mtime(filename)
+                    await http.download_media(
+                        url, filename, False, segments, skip_existing
+                    )
+                    report._add(filename, mtime)
+                except Exception as error:
+                    report.failed[key] = error
+
+            pbar.update(1)
+            pbar.set_postfix_str(f"{report.bytes / 1e6:.1f}MB")
+
+        await asyncio.gather(*(fetch(key, url) for key, (_, url) in media.items()))
+
+    return report._finish()
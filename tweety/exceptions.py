@@ -610,3 +610,25 @@ class AuthenticationRequired(Exception):
         self.error_name = error_name
         self.response = response
         super().__init__(self.message)
+
+
+class RateLimitExceeded(Exception):
+    """
+    Exception Raised when the rate limit of an endpoint is exhausted
+
+    Attributes:
+        message -- explanation of the error
+    """
+
+    def __init__(
+        self,
+        error_code,
+        error_name,
+        response,
+        message="Rate limit exceeded, wait for the window to reset",
+    ):
+        self.message = message
+        self.error_code = error_code
+        self.error_name = error_name
+        self.response = response
+        super().__init__(self.message)
@@ -0,0 +1,100 @@
+import threading
+import time
+from typing import List, Optional
+
+import httpx as s
+
+# RateLimitExceeded, BadGuestToken
+RETIRE_ERROR_CODES = (88, 239)
+RETIRE_STATUS_CODES = (403,)
+
+
+class GuestTokenPool:
+    """
+    Round-robin pool of guest tokens
+
+    The pool only keeps track of the tokens, fetching new ones is left to the
+    `RequestMaker` which asks for `missing()` and `get_expiring()` tokens and
+    refills the pool in the background.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_age: float = 3 * 60 * 60,
+        refresh_margin: float = 15 * 60,
+    ):
+        """
+        :param size: (`int`) number of tokens to keep warm
+        :param max_age: (`float`) seconds after which a token is considered expired
+        :param refresh_margin: (`float`) seconds before `max_age` at which a token gets replaced
+        """
+
+        self.size = max(int(size), 1)
+        self.max_age = max_age
+        self.refresh_margin = refresh_margin
+        self.__tokens = []
+        self.__index = 0
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def should_retire(error: BaseException) -> bool:
+        """
+        Whether `error` means the token used for the request is exhausted or invalid
+        """
+
+        if getattr(error, "error_code", None) in RETIRE_ERROR_CODES:
+            return True
+
+        response = getattr(error, "response", None)
+        return (
+            isinstance(response, s.Response)
+            and response.status_code in RETIRE_STATUS_CODES
+        )
+
+    def add(self, token: str, created_at: Optional[float] = None):
+        with self.__lock:
+            self.__tokens.append((token, created_at or time.time()))
+
+    def get(self) -> Optional[str]:
+        """
+        Next usable token in round-robin order, `None` if the pool ran dry
+        """
+
+        with self.__lock:
+            now = time.time()
+            self.__tokens = [
+                (token, created_at)
+                for token, created_at in self.__tokens
+                if now - created_at < self.max_age
+            ]
+            if not self.__tokens:
+                return None
+
+            self.__index = (self.__index + 1) % len(self.__tokens)
+            return self.__tokens[self.__index][0]
+
+    def retire(self, token: str):
+        with self.__lock:
+            self.__tokens = [i for i in self.__tokens if i[0] != token]
+
+    def missing(self) -> int:
+        with self.__lock:
+            return max(self.size - len(self.__tokens), 0)
+
+    def get_expiring(self) -> List[str]:
+        with self.__lock:
+            deadline = time.time() - (self.max_age - self.refresh_margin)
+            return [
+                token for token, created_at in self.__tokens if created_at <= deadline
+            ]
+
+    def needs_refresh(self) -> bool:
+        return self.missing() > 0 or len(self.get_expiring()) > 0
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__tokens)
+
+    def __repr__(self):
+        return f"GuestTokenPool(size={self.size}, tokens={len(self)})"
@@ -1,66 +1,419 @@
+import asyncio
+import json
 import os
-from typing import Any, Optional
+import threading
+import time
+from typing import Any, Callable, Optional, Union
 
 import httpx as s
-from tqdm import tqdm
 
 from .builder import UrlBuilder
+from .cache import ResponseCache
+from .download import AsyncChunkedDownloader, ChunkedDownloader
 from .exceptions import GuestTokenNotFound, UnknownError, UserNotFound
+from .guest import GuestTokenPool
+from .proxy import ProxyPool, get_proxy_url
+from .ratelimit import RateLimiter
+from .retry import RequestStats, RetryPolicy, get_retry_reason
 from .types.n_types import GenericError, SearchFilter
 
 
-class RequestMaker:
+# `lazy` mode of `RequestMaker` which fetches the first guest token in a background thread
+LAZY_BACKGROUND = "background"
+
+JsonDecoder = Callable[[Union[bytes, str]], Any]
+
+
+def _get_default_json_decoder() -> JsonDecoder:
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+
+        return msgspec.json.decode
+    except ImportError:
+        pass
+
+    return json.loads
+
+
+_json_decoder = _get_default_json_decoder()
+
+
+def set_json_decoder(decoder: Optional[JsonDecoder] = None) -> JsonDecoder:
+    """
+    Replace the function used to decode every API response
+
+    The decoder is given the raw response bytes. By default `orjson` or `msgspec` are used when installed,
+    falling back to the stdlib `json`; pass `None` to restore that default.
+
+    :param decoder: (`Callable[[bytes], Any]`) e.g. `orjson.loads`, `msgspec.json.decode` or `json.loads`
+
+    :return: the previous decoder
+    """
+
+    global _json_decoder
+    previous = _json_decoder
+    _json_decoder = decoder or _get_default_json_decoder()
+    return previous
+
+
+def _get_limits(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = 5.0,
+) -> s.Limits:
+    if max_keepalive_connections is None:
+        max_keepalive_connections = max_connections or 20
+
+    return s.Limits(
+        max_connections=max_connections or 100,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def _get_proxy_pool(proxy: Any) -> Optional[ProxyPool]:
+    if isinstance(proxy, ProxyPool):
+        return proxy
+
+    if isinstance(proxy, (list, tuple)):
+        return ProxyPool(proxy)
+
+    return None
+
+
+def _get_cache(cache: Any) -> Optional[ResponseCache]:
+    if isinstance(cache, str):
+        return ResponseCache(cache)
+
+    return cache
+
+
+def _get_rate_limit_key(endpoint: str, guest_token: Optional[str] = None) -> str:
+    # the rate limits are counted per guest token
+    return f"{endpoint}:{guest_token}" if guest_token else endpoint
+
+
+def _parse_response(response: s.Response) -> Any:
+    try:
+        response_json = _json_decoder(response.content)
+    except BaseException:
+        response_json = None
+
+    if not response_json:
+        raise UnknownError(
+            error_code=500,
+            error_name="Server Error",
+            response=response,
+            message="Unknown Error Occurs on Twitter",
+        )
+
+    if response_json.get("errors") and not response_json.get("data"):
+        error = response_json["errors"][0]
+        return GenericError(
+            response, error.get("code"), error.get("message")
+        )._raise_exception()
+
+    return response_json
+
+
+class _BaseRequestMaker:
+    """
+    Decisions shared by `RequestMaker` and `AsyncRequestMaker`: which guest token to retire,
+    how long to wait before a retry and what to do with a response. The subclasses only
+    send the requests and wait, with threads or with `await`
+    """
+
+    proxies: Optional[ProxyPool]
+    rate_limiter: Optional[RateLimiter]
+    retry_policy: RetryPolicy
+    stats: RequestStats
+    cache: Optional[ResponseCache]
+    guest_tokens: GuestTokenPool
+
+    def _get_cached_response(self, request_data: dict) -> Any:
+        if self.cache is None:
+            return None
+
+        cached = self.cache.get(request_data["method"], request_data["url"])
+        if cached is None:
+            return None
+
+        self.stats.add("cache_hits")
+        return _json_decoder(cached)
+
+    def _get_retry_delay(
+        self,
+        error: Exception,
+        method: str,
+        rate_limit_key: str,
+        guest_token: Optional[str],
+        attempt: int,
+    ) -> Optional[float]:
+        """
+        Retire `guest_token` if `error` calls for it and count the attempt
+
+        :return: seconds to wait before the next attempt, `None` if `error` should be raised
+        """
+
+        retired = bool(guest_token) and GuestTokenPool.should_retire(error)
+        if retired:
+            self.guest_tokens.retire(guest_token)
+            self.stats.add("guest_tokens_retired")
+
+        reset_delay = (
+            self.rate_limiter.get_reset_delay(rate_limit_key)
+            if self.rate_limiter and not retired
+            else None
+        )
+        delay = self.retry_policy.get_delay(
+            error, method, attempt, reset_delay, retired
+        )
+        if delay is None:
+            self.stats.add("failures")
+            return None
+
+        self.stats.add("retries")
+        self.stats.add(f"retries:{get_retry_reason(error)}")
+        return delay
+
+    def _report_proxy_error(self, proxy: Optional[str], error: Exception):
+        if self.proxies:
+            self.proxies.report(proxy, error=error)
+
+    def _read_response(
+        self,
+        response: s.Response,
+        rate_limit_key: str,
+        request_data: dict,
+        proxy: Optional[str],
+        started: float,
+    ) -> Any:
+        if self.proxies:
+            self.proxies.report(
+                proxy, time.perf_counter() - started, response.status_code
+            )
+
+        if self.rate_limiter:
+            self.rate_limiter.update(rate_limit_key, response.headers)
+
+        response_json = _parse_response(response)
+        if self.cache is not None:
+            self.cache.set(
+                request_data["method"], request_data["url"], response.content
+            )
+
+        return response_json
+
+    @staticmethod
+    def _get_guest_token_not_found() -> GuestTokenNotFound:
+        return GuestTokenNotFound(None, None, None, "Guest Token couldn't be found.")
+
+    def _keep_guest_token(self, guest_token: str) -> str:
+        self.guest_tokens.add(guest_token)
+        self.stats.add("guest_tokens")
+        return guest_token
+
+    def _iter_guest_tokens_to_add(self):
+        """
+        Yield once for every guest token to add to the pool: first for each expiring token,
+        which is retired once its replacement is added, then until the pool is full
+        """
+
+        for guest_token in self.guest_tokens.get_expiring():
+            yield guest_token
+            self.guest_tokens.retire(guest_token)
+
+        while self.guest_tokens.missing() > 0:
+            yield None
+
+
+class RequestMaker(_BaseRequestMaker):
     def __init__(
         self,
         max_retries: int = 10,
         proxy: Optional[Any] = None,
+        max_connections: Optional[int] = None,
+        rate_limit: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        guest_tokens: int = 1,
+        lazy: Union[bool, str] = False,
+        http2: bool = False,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = 5.0,
+        cache: Optional[Union[ResponseCache, str]] = None,
     ):
-        self.__session = s.Client(proxies=proxy, timeout=60)
-        self.__builder = UrlBuilder(self.__session.cookies)
-        self.__builder.guest_token = self._get_guest_token(max_retries)
+        self.proxies = _get_proxy_pool(proxy)
+        self.__proxy = None if self.proxies else get_proxy_url(proxy)
+        self.__limits = _get_limits(
+            max_connections, max_keepalive_connections, keepalive_expiry
+        )
+        self.__http2 = http2
+        self.__cookies = s.Cookies()
+        self.__sessions = {}
+        self.__sessions_lock = threading.Lock()
+        self.__builder = UrlBuilder(self.__cookies)
+        self.rate_limiter = RateLimiter() if rate_limit else None
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.stats = RequestStats()
+        self.cache = _get_cache(cache)
+        self.guest_tokens = GuestTokenPool(size=guest_tokens)
+        self.__guest_token_lock = threading.Lock()
+        self.__refresh_lock = threading.Lock()
+        self.__refresh_thread = None
+
+        if lazy == LAZY_BACKGROUND:
+            self._refresh_guest_tokens_in_background()
+        elif not lazy:
+            self.__builder.guest_token = self._add_guest_token()
+            self._refresh_guest_tokens_in_background()
 
     def __get_response__(self, **request_data) -> Any:
-        response = self.__session.request(**request_data)
+        cached = self._get_cached_response(request_data)
+        if cached is not None:
+            return cached
+
+        endpoint = RateLimiter.get_endpoint(request_data["url"])
+        attempt = 0
+        while True:
+            guest_token = None
+            if "x-guest-token" in request_data["headers"]:
+                guest_token = self._next_guest_token()
+                request_data["headers"]["x-guest-token"] = guest_token
+
+            rate_limit_key = _get_rate_limit_key(endpoint, guest_token)
+            try:
+                return self.__send__(rate_limit_key, request_data)
+            except Exception as error:
+                delay = self._get_retry_delay(
+                    error, request_data["method"], rate_limit_key, guest_token, attempt
+                )
+                if delay is None:
+                    raise
+
+                time.sleep(delay)
+                attempt += 1
+
+    def __get_session__(self, proxy: Optional[str] = None) -> s.Client:
+        # one connection pool per proxy, sharing the cookies
+        session = self.__sessions.get(proxy)
+        if session is None:
+            with self.__sessions_lock:
+                session = self.__sessions.get(proxy)
+                if session is None:
+                    session = self.__sessions[proxy] = s.Client(
+                        proxies=proxy,
+                        timeout=60,
+                        http2=self.__http2,
+                        limits=self.__limits,
+                        cookies=self.__cookies.jar,
+                    )
+
+        return session
+
+    def __send__(self, endpoint: str, request_data: dict) -> Any:
+        if self.rate_limiter:
+            self.rate_limiter.acquire(endpoint)
+
+        proxy = self.proxies.get() if self.proxies else self.__proxy
+        self.stats.add("requests")
+        started = time.perf_counter()
         try:
-            response_json = response.json()
-        except BaseException:
-            response_json = None
-
-        if not response_json:
-            raise UnknownError(
-                error_code=500,
-                error_name="Server Error",
-                response=response,
-                message="Unknown Error Occurs on Twitter",
-            )
+            response = self.__get_session__(proxy).request(**request_data)
+        except Exception as error:
+            self._report_proxy_error(proxy, error)
+            raise
 
-        if response_json.get("errors") and not response_json.get("data"):
-            error = response_json["errors"][0]
-            return GenericError(
-                response, error.get("code"), error.get("message")
-            )._raise_exception()
+        return self._read_response(response, endpoint, request_data, proxy, started)
 
-        return response_json
+    def __request__(self, request_builder, *args, **kwargs) -> Any:
+        self._ensure_guest_token()
+        return self.__get_response__(**request_builder(*args, **kwargs))
+
+    def _ensure_guest_token(self):
+        if self.__builder.guest_token:
+            return
+
+        with self.__guest_token_lock:
+            if self.__builder.guest_token:
+                return
 
-    def _get_guest_token(self, max_retries: int = 10):
-        for _ in range(max_retries):
-            response = self.__get_response__(**self.__builder.get_guest_token())
+            # a lazy="background" client may already be fetching the first token
+            refresh_thread = self.__refresh_thread
+            while (
+                not len(self.guest_tokens)
+                and refresh_thread
+                and refresh_thread.is_alive()
+            ):
+                refresh_thread.join(0.05)
+
+            self.__builder.guest_token = (
+                self.guest_tokens.get() or self._add_guest_token()
+            )
+
+        self._refresh_guest_tokens_in_background()
+
+    def _get_guest_token(self):
+        # `__get_response__` already retries by `retry_policy`, a failed token is retried
+        # by the next request or refresh instead of being retried here on top of it
+        request_data = self.__builder.get_guest_token()
+        request_data["headers"].pop("x-guest-token", None)
+        try:
+            response = self.__get_response__(**request_data)
             return response["guest_token"]  # noqa
+        except Exception as error:
+            raise self._get_guest_token_not_found() from error
 
-        raise GuestTokenNotFound(
-            None,
-            None,
-            None,
-            f"Guest Token couldn't be found after {max_retries} retries.",
-        )
+    def _add_guest_token(self) -> str:
+        return self._keep_guest_token(self._get_guest_token())
+
+    def _next_guest_token(self) -> str:
+        guest_token = self.guest_tokens.get()
+        if guest_token is None:
+            # every token expired or got retired, nothing to do but wait for a new one
+            with self.__guest_token_lock:
+                guest_token = self.guest_tokens.get() or self._add_guest_token()
+
+        if self.guest_tokens.needs_refresh():
+            self._refresh_guest_tokens_in_background()
+
+        return guest_token
+
+    def _refresh_guest_tokens_in_background(self):
+        with self.__refresh_lock:
+            if self.__refresh_thread and self.__refresh_thread.is_alive():
+                return
+
+            if not self.guest_tokens.needs_refresh():
+                return
+
+            self.__refresh_thread = threading.Thread(
+                target=self._refresh_guest_tokens, daemon=True
+            )
+            self.__refresh_thread.start()
+
+    def _refresh_guest_tokens(self):
+        try:
+            for _ in self._iter_guest_tokens_to_add():
+                self._add_guest_token()
+        except GuestTokenNotFound:
+            # the pool keeps serving the tokens it still has, the next request tries again
+            pass
 
     def _init_api(self):
+        self._ensure_guest_token()
         data = self.__builder.init_api()
         data["json"] = {}
         self.__get_response__(**data)
 
     def get_user(self, username: str):
-        response = self.__get_response__(**self.__builder.user_by_screen_name(username))
+        response = self.__request__(self.__builder.user_by_screen_name, username)
 
         if response.get("data"):  # noqa
             return response
@@ -72,14 +425,13 @@ class RequestMaker:
     def get_tweets(
         self, user_id: int, replies: bool = False, cursor: Optional[str] = None
     ):
-        request_data = self.__builder.user_tweets(
-            user_id=user_id, replies=replies, cursor=cursor
+        response = self.__request__(
+            self.__builder.user_tweets, user_id=user_id, replies=replies, cursor=cursor
         )
-        response = self.__get_response__(**request_data)
         return response
 
     def get_trends(self):
-        response = self.__get_response__(**self.__builder.trends())
+        response = self.__request__(self.__builder.trends)
         return response
 
     def get_search_tweets(
@@ -88,39 +440,240 @@ class RequestMaker:
         search_filter: SearchFilter = "live",
         cursor: Optional[str] = None,
     ):
-        response = self.__get_response__(
-            **self.__builder.search(query, search_filter, cursor)
+        response = self.__request__(
+            self.__builder.search, query, search_filter, cursor
         )
         return response
 
-    def get_tweet_detail(self, tweet_id: int):
-        response = self.__get_response__(**self.__builder.tweet_detail(tweet_id))
+    def get_tweet_detail(self, tweet_id: int, cursor: Optional[str] = None):
+        response = self.__request__(self.__builder.tweet_detail, tweet_id, cursor)
         return response
 
     def download_media(
-        self, media_url: str, filename: Optional[str] = None, show_progress: bool = True
+        self,
+        media_url: str,
+        filename: Optional[str] = None,
+        show_progress: bool = True,
+        segments: int = 4,
+        skip_existing: bool = False,
+    ):
+        filename = (
+            os.path.basename(media_url).split("?")[0] if not filename else filename
+        )
+
+        proxy = self.proxies.get(track=False) if self.proxies else self.__proxy
+        downloader = ChunkedDownloader(self.__get_session__(proxy), segments)
+        return downloader.download(
+            media_url, filename, show_progress, skip_existing
+        )
+
+
+class AsyncRequestMaker(_BaseRequestMaker):
+    """
+    `asyncio` counterpart of `RequestMaker`, backed by `httpx.AsyncClient`
+
+    The guest token can't be fetched from a constructor, so it is obtained
+    on the first request instead and shared by every request made after it.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 10,
+        proxy: Optional[Any] = None,
+        max_connections: Optional[int] = None,
+        rate_limit: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        guest_tokens: int = 1,
+        http2: bool = False,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = 5.0,
+        cache: Optional[Union[ResponseCache, str]] = None,
+    ):
+        self.proxies = _get_proxy_pool(proxy)
+        self.__proxy = None if self.proxies else get_proxy_url(proxy)
+        self.__limits = _get_limits(
+            max_connections, max_keepalive_connections, keepalive_expiry
+        )
+        self.__http2 = http2
+        self.__cookies = s.Cookies()
+        self.__sessions = {}
+        self.__builder = UrlBuilder(self.__cookies)
+        self.rate_limiter = RateLimiter() if rate_limit else None
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.stats = RequestStats()
+        self.cache = _get_cache(cache)
+        self.guest_tokens = GuestTokenPool(size=guest_tokens)
+        self.__guest_token_lock = None
+        self.__refresh_task = None
+
+    async def __get_response__(self, **request_data) -> Any:
+        cached = self._get_cached_response(request_data)
+        if cached is not None:
+            return cached
+
+        endpoint = RateLimiter.get_endpoint(request_data["url"])
+        attempt = 0
+        while True:
+            guest_token = None
+            if "x-guest-token" in request_data["headers"]:
+                guest_token = await self._next_guest_token()
+                request_data["headers"]["x-guest-token"] = guest_token
+
+            rate_limit_key = _get_rate_limit_key(endpoint, guest_token)
+            try:
+                return await self.__send__(rate_limit_key, request_data)
+            except Exception as error:
+                delay = self._get_retry_delay(
+                    error, request_data["method"], rate_limit_key, guest_token, attempt
+                )
+                if delay is None:
+                    raise
+
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def __get_session__(self, proxy: Optional[str] = None) -> s.AsyncClient:
+        # one connection pool per proxy, sharing the cookies
+        session = self.__sessions.get(proxy)
+        if session is None:
+            session = self.__sessions[proxy] = s.AsyncClient(
+                proxies=proxy,
+                timeout=60,
+                http2=self.__http2,
+                limits=self.__limits,
+                cookies=self.__cookies.jar,
+            )
+
+        return session
+
+    async def __send__(self, endpoint: str, request_data: dict) -> Any:
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async(endpoint)
+
+        proxy = self.proxies.get() if self.proxies else self.__proxy
+        self.stats.add("requests")
+        started = time.perf_counter()
+        try:
+            response = await self.__get_session__(proxy).request(**request_data)
+        except Exception as error:
+            self._report_proxy_error(proxy, error)
+            raise
+
+        return self._read_response(response, endpoint, request_data, proxy, started)
+
+    async def __request__(self, request_builder, *args, **kwargs) -> Any:
+        await self._ensure_guest_token()
+        return await self.__get_response__(**request_builder(*args, **kwargs))
+
+    async def _ensure_guest_token(self):
+        if self.__builder.guest_token:
+            return
+
+        if self.__guest_token_lock is None:
+            self.__guest_token_lock = asyncio.Lock()
+
+        async with self.__guest_token_lock:
+            if not self.__builder.guest_token:
+                self.__builder.guest_token = await self._add_guest_token()
+                self._refresh_guest_tokens_in_background()
+
+    async def _get_guest_token(self):
+        # `__get_response__` already retries by `retry_policy`, a failed token is retried
+        # by the next request or refresh instead of being retried here on top of it
+        request_data = self.__builder.get_guest_token()
+        request_data["headers"].pop("x-guest-token", None)
+        try:
+            response = await self.__get_response__(**request_data)
+            return response["guest_token"]  # noqa
+        except Exception as error:
+            raise self._get_guest_token_not_found() from error
+
+    async def _add_guest_token(self) -> str:
+        return self._keep_guest_token(await self._get_guest_token())
+
+    async def _next_guest_token(self) -> str:
+        guest_token = self.guest_tokens.get()
+        if guest_token is None:
+            # every token expired or got retired, nothing to do but wait for a new one
+            async with self.__guest_token_lock:
+                guest_token = self.guest_tokens.get() or await self._add_guest_token()
+
+        if self.guest_tokens.needs_refresh():
+            self._refresh_guest_tokens_in_background()
+
+        return guest_token
+
+    def _refresh_guest_tokens_in_background(self):
+        if self.__refresh_task and not self.__refresh_task.done():
+            return
+
+        if not self.guest_tokens.needs_refresh():
+            return
+
+        self.__refresh_task = asyncio.ensure_future(self._refresh_guest_tokens())
+
+    async def _refresh_guest_tokens(self):
+        try:
+            for _ in self._iter_guest_tokens_to_add():
+                await self._add_guest_token()
+        except GuestTokenNotFound:
+            # the pool keeps serving the tokens it still has, the next request tries again
+            pass
+
+    async def get_user(self, username: str):
+        response = await self.__request__(self.__builder.user_by_screen_name, username)
+
+        if response.get("data"):  # noqa
+            return response
+
+        raise UserNotFound(
+            error_code=50, error_name="GenericUserNotFound", response=response
+        )
+
+    async def get_tweets(
+        self, user_id: int, replies: bool = False, cursor: Optional[str] = None
+    ):
+        return await self.__request__(
+            self.__builder.user_tweets, user_id=user_id, replies=replies, cursor=cursor
+        )
+
+    async def get_trends(self):
+        return await self.__request__(self.__builder.trends)
+
+    async def get_search_tweets(
+        self,
+        query: str,
+        search_filter: SearchFilter = "live",
+        cursor: Optional[str] = None,
+    ):
+        return await self.__request__(
+            self.__builder.search, query, search_filter, cursor
+        )
+
+    async def get_tweet_detail(self, tweet_id: int, cursor: Optional[str] = None):
+        return await self.__request__(self.__builder.tweet_detail, tweet_id, cursor)
+
+    async def download_media(
+        self,
+        media_url: str,
+        filename: Optional[str] = None,
+        show_progress: bool = True,
+        segments: int = 4,
+        skip_existing: bool = False,
     ):
         filename = (
             os.path.basename(media_url).split("?")[0] if not filename else filename
         )
 
-        with self.__session.stream("GET", media_url) as response:
-            response.raise_for_status()
-            content_length = int(response.headers["Content-Length"])
-            f = open(filename, "wb")
-            if show_progress:
-                with tqdm(
-                    total=content_length,
-                    unit="B",
-                    unit_scale=True,
-                    desc=f"[{filename}]",
-                ) as pbar:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                        pbar.update(len(chunk))
-            else:
-                for chunk in response.iter_bytes(chunk_size=8192):
-                    f.write(chunk)
-            f.close()
-
-        return filename
+        proxy = self.proxies.get(track=False) if self.proxies else self.__proxy
+        downloader = AsyncChunkedDownloader(self.__get_session__(proxy), segments)
+        return await downloader.download(
+            media_url, filename, show_progress, skip_existing
+        )
+
+    async def aclose(self):
+        if self.__refresh_task and not self.__refresh_task.done():
+            self.__refresh_task.cancel()
+
+        for session in self.__sessions.values():
+            await session.aclose()
@@ -0,0 +1,206 @@
+import random
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import httpx as s
+
+from .types.n_types import Proxy
+
+# Forbidden (banned egress IP), Proxy Authentication Required, Too Many Requests
+BAN_STATUS_CODES = (403, 407, 429)
+
+
+def get_proxy_url(proxy: Any) -> Optional[str]:
+    """
+    Normalise a `Proxy`, an url string or a `requests` / `httpx` style mapping into a single proxy url
+    """
+
+    if not proxy:
+        return None
+
+    if isinstance(proxy, Proxy):
+        return proxy.url
+
+    if isinstance(proxy, str):
+        return proxy
+
+    if isinstance(proxy, dict):
+        for key in ("https://", "https", "all://", "http://", "http"):
+            if proxy.get(key):
+                return proxy[key]
+
+    raise TypeError(f"Unsupported proxy: {proxy!r}")
+
+
+class ProxyHealth:
+    """
+    Moving averages of the latency and error rate of a single proxy
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.latency = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.ejected_until = 0.0
+        self.ejections = 0
+
+    def is_ejected(self, now: Optional[float] = None) -> bool:
+        return self.ejected_until > (now or time.time())
+
+    def score(self, default_latency: float) -> float:
+        # lower is better: slow, failing and busy proxies all get pushed back
+        latency = default_latency if self.latency is None else self.latency
+        return latency * (1 + self.in_flight) / max(1 - self.error_rate, 0.05)
+
+    def __repr__(self):
+        return (
+            f"ProxyHealth(url={self.url!r}, latency={self.latency}, error_rate={self.error_rate:.2f}, "
+            f"requests={self.requests}, ejected={self.is_ejected()})"
+        )
+
+
+class ProxyPool:
+    """
+    Spreads requests across several egress proxies, keeping track of how well each one behaves
+
+    Every request goes to the better of two randomly picked healthy proxies, scored on
+    their average latency, error rate and requests in flight. Proxies that turn slow,
+    keep failing or get banned are ejected for `cooldown` seconds and then readmitted
+    with a clean slate. The pool never runs dry: with every proxy ejected, the one
+    closest to the end of its cooldown is used.
+    """
+
+    def __init__(
+        self,
+        proxies: Iterable[Any],
+        max_latency: float = 10.0,
+        max_error_rate: float = 0.5,
+        min_requests: int = 5,
+        cooldown: float = 5 * 60,
+        smoothing: float = 0.2,
+    ):
+        """
+        :param proxies: (`list[str | dict | Proxy]`) the proxies to spread the requests across
+        :param max_latency: (`float`) eject a proxy once its average latency goes over this many seconds
+        :param max_error_rate: (`float`) eject a proxy once its average error rate goes over this fraction
+        :param min_requests: (`int`) requests a proxy has to serve before its averages are trusted
+        :param cooldown: (`float`) seconds an ejected proxy stays out of rotation
+        :param smoothing: (`float`) weight of the newest sample in the moving averages
+        """
+
+        urls = list(dict.fromkeys(get_proxy_url(proxy) for proxy in proxies))
+        if not urls or None in urls:
+            raise ValueError("ProxyPool needs at least one proxy")
+
+        self.max_latency = max_latency
+        self.max_error_rate = max_error_rate
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self.health: Dict[str, ProxyHealth] = {url: ProxyHealth(url) for url in urls}
+        self.__lock = threading.Lock()
+
+    @property
+    def urls(self) -> List[str]:
+        return list(self.health)
+
+    def get(self, track: bool = True) -> str:
+        """
+        Pick the proxy for the next request
+
+        :param track: (`bool`) count the request as in flight, it has to be handed back to `report` once done
+        """
+
+        with self.__lock:
+            now = time.time()
+            candidates = [i for i in self.health.values() if not i.is_ejected(now)]
+            for health in candidates:
+                if health.ejected_until:
+                    # back from its cooldown, start over
+                    self.__reset(health)
+
+            if not candidates:
+                candidates = [min(self.health.values(), key=lambda i: i.ejected_until)]
+
+            latencies = [i.latency for i in candidates if i.latency is not None]
+            default_latency = sum(latencies) / len(latencies) if latencies else 1.0
+            picked = random.sample(candidates, min(len(candidates), 2))
+            health = min(picked, key=lambda i: i.score(default_latency))
+            if track:
+                health.in_flight += 1
+
+            return health.url
+
+    def report(
+        self,
+        url: str,
+        latency: Optional[float] = None,
+        status_code: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ):
+        """
+        Record the outcome of a request made through `url`
+
+        :param url: (`str`) the proxy returned by `get`
+        :param latency: (`float`) seconds the request took, if it got a response
+        :param status_code: (`int`) status code of the response
+        :param error: the transport error raised instead of a response
+        """
+
+        with self.__lock:
+            health = self.health.get(url)
+            if health is None:
+                return
+
+            health.in_flight = max(health.in_flight - 1, 0)
+            health.requests += 1
+
+            failed = error is not None or (
+                status_code is not None
+                and (status_code in BAN_STATUS_CODES or status_code >= 500)
+            )
+            if failed:
+                health.failures += 1
+
+            health.error_rate += self.smoothing * (float(failed) - health.error_rate)
+            if latency is not None:
+                health.latency = (
+                    latency
+                    if health.latency is None
+                    else health.latency + self.smoothing * (latency - health.latency)
+                )
+
+            if isinstance(error, s.ProxyError) or status_code == 407:
+                # the proxy itself refused us, no point in waiting for more samples
+                self.__eject(health)
+            elif health.requests >= self.min_requests and (
+                health.error_rate > self.max_error_rate
+                or (health.latency or 0) > self.max_latency
+            ):
+                self.__eject(health)
+
+    def __eject(self, health: ProxyHealth):
+        health.ejected_until = time.time() + self.cooldown
+        health.ejections += 1
+
+    @staticmethod
+    def __reset(health: ProxyHealth):
+        health.latency = None
+        health.error_rate = 0.0
+        health.requests = 0
+        health.failures = 0
+        health.ejected_until = 0.0
+
+    def __len__(self):
+        return len(self.health)
+
+    def __repr__(self):
+        with self.__lock:
+            now = time.time()
+            healthy = sum(not i.is_ejected(now) for i in self.health.values())
+
+        return f"ProxyPool(proxies={len(self)}, healthy={healthy})"
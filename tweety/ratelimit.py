@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+
+class RateLimitBucket:
+    def __init__(self, limit: int, remaining: int, reset: float):
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+
+    def __repr__(self):
+        return f"RateLimitBucket(limit={self.limit}, remaining={self.remaining}, reset={self.reset})"
+
+
+class RateLimiter:
+    """
+    Per endpoint token bucket fed by the `x-rate-limit-*` response headers
+
+    Requests go out immediately while the endpoint has quota left in its window and
+    only park until `x-rate-limit-reset` once the quota is used up. Endpoints which
+    never sent the headers are not limited at all.
+    """
+
+    HEADER_LIMIT = "x-rate-limit-limit"
+    HEADER_REMAINING = "x-rate-limit-remaining"
+    HEADER_RESET = "x-rate-limit-reset"
+
+    def __init__(self, margin: float = 1.0):
+        """
+        :param margin: (`float`) extra seconds to wait past the reset time, to absorb clock skew
+        """
+
+        self.margin = margin
+        self.buckets: Dict[str, RateLimitBucket] = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def get_endpoint(url: str) -> str:
+        return urlsplit(str(url)).path
+
+    def _reserve(self, endpoint: str) -> float:
+        with self.__lock:
+            bucket = self.buckets.get(endpoint)
+            if bucket is None:
+                return 0
+
+            now = time.time()
+            if now >= bucket.reset + self.margin:
+                # new window, the next response will tell the real numbers
+                del self.buckets[endpoint]
+                return 0
+
+            if bucket.remaining > 0:
+                bucket.remaining -= 1
+                return 0
+
+            return bucket.reset + self.margin - now
+
+    def acquire(self, endpoint: str):
+        """
+        Block until a request to `endpoint` fits in its rate limit window
+        """
+
+        delay = self._reserve(endpoint)
+        while delay > 0:
+            time.sleep(delay)
+            delay = self._reserve(endpoint)
+
+    async def acquire_async(self, endpoint: str):
+        """
+        `asyncio` counterpart of `acquire`
+        """
+
+        delay = self._reserve(endpoint)
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._reserve(endpoint)
+
+    def update(self, endpoint: str, headers: Mapping[str, str]):
+        """
+        Refresh the bucket of `endpoint` from the headers of one of its responses
+        """
+
+        bucket = self._parse_headers(headers)
+        if bucket is None:
+            return
+
+        with self.__lock:
+            self.buckets[endpoint] = bucket
+
+    def get_reset_delay(self, endpoint: str) -> Optional[float]:
+        """
+        Seconds until the window of `endpoint` resets, `None` if it is unknown
+        """
+
+        bucket = self.buckets.get(endpoint)
+        if bucket is None:
+            return None
+
+        return max(bucket.reset + self.margin - time.time(), 0)
+
+    def _parse_headers(self, headers: Mapping[str, str]) -> Optional[RateLimitBucket]:
+        try:
+            remaining = int(headers[self.HEADER_REMAINING])
+            reset = float(headers[self.HEADER_RESET])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        try:
+            limit = int(headers[self.HEADER_LIMIT])
+        except (KeyError, TypeError, ValueError):
+            limit = remaining
+
+        return RateLimitBucket(limit, remaining, reset)
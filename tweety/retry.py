@@ -0,0 +1,160 @@
+import random
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Optional, Union
+
+import httpx as s
+
+WAIT_FOR_RESET = "wait_for_reset"
+
+RetryRule = Union[bool, str]
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is retried, and how long to wait before doing so
+
+    Transport errors (timeouts, dropped connections) and the status / error codes below
+    are retried with exponential backoff and full jitter. Rate limit errors wait for the
+    window reported by Twitter instead. Only idempotent methods are retried.
+
+    An error status of the response decides on its own, other 4xx are never retried. The
+    error codes only apply to errors sent with a successful status (e.g. GraphQL errors).
+    """
+
+    RETRY_METHODS = ("GET", "HEAD", "OPTIONS")
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    RETRY_ERROR_CODES: Dict[int, RetryRule] = {
+        88: WAIT_FOR_RESET,  # RateLimitExceeded
+        130: True,  # OverCapacity
+        131: True,  # InternalError
+        500: True,  # non json body with a successful status, see `UnknownError`
+    }
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        max_reset_wait: float = 15 * 60,
+        retry_methods: Optional[Iterable[str]] = None,
+        status_codes: Optional[Iterable[int]] = None,
+        error_codes: Optional[Dict[int, RetryRule]] = None,
+    ):
+        """
+        :param max_retries: (`int`) retries per request, `0` disables retrying
+        :param backoff_factor: (`float`) the n-th retry waits up to `backoff_factor * 2 ** n` seconds
+        :param max_backoff: (`float`) upper bound of a single backoff
+        :param jitter: (`bool`) pick the backoff uniformly between 0 and its upper bound
+        :param max_reset_wait: (`float`) give up instead of waiting longer than this for a rate limit reset
+        :param retry_methods: (`list[str]`) HTTP methods which are safe to retry
+        :param status_codes: (`list[int]`) HTTP status codes to retry
+        :param error_codes: (`dict[int, bool | str]`) Twitter error codes to retry (`True`), never retry (`False`)
+                            or retry once the rate limit resets (`WAIT_FOR_RESET`), merged over `RETRY_ERROR_CODES`
+        """
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.max_reset_wait = max_reset_wait
+        self.retry_methods = tuple(
+            i.upper() for i in (retry_methods or self.RETRY_METHODS)
+        )
+        self.status_codes = tuple(status_codes or self.RETRY_STATUS_CODES)
+        self.error_codes = {**self.RETRY_ERROR_CODES, **(error_codes or {})}
+
+    def get_rule(self, error: BaseException) -> RetryRule:
+        if isinstance(error, s.TransportError):
+            return True
+
+        status_code = _get_status_code(error)
+        if status_code == 429:
+            return WAIT_FOR_RESET
+
+        if status_code is not None and status_code >= 400:
+            return status_code in self.status_codes
+
+        return self.error_codes.get(getattr(error, "error_code", None), False)
+
+    def get_backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def get_delay(
+        self,
+        error: BaseException,
+        method: str,
+        attempt: int,
+        reset_delay: Optional[float] = None,
+        force: bool = False,
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying, `None` if the request shouldn't be retried
+
+        :param error: the exception raised by the request
+        :param method: (`str`) HTTP method of the request
+        :param attempt: (`int`) number of retries already made for this request
+        :param reset_delay: (`float`) seconds until the rate limit window of the endpoint resets, if known
+        :param force: (`bool`) retry regardless of the error rules, i.e. when the guest token was swapped
+        """
+
+        if attempt >= self.max_retries or str(method).upper() not in self.retry_methods:
+            return None
+
+        rule = True if force else self.get_rule(error)
+        if not rule:
+            return None
+
+        if rule == WAIT_FOR_RESET and reset_delay is not None:
+            if reset_delay > self.max_reset_wait:
+                return None
+
+            return reset_delay + random.uniform(0, 1)
+
+        return self.get_backoff(attempt)
+
+
+def _get_status_code(error: BaseException) -> Optional[int]:
+    response = getattr(error, "response", None)
+    if isinstance(response, s.Response):
+        return response.status_code
+
+    return None
+
+
+def get_retry_reason(error: BaseException) -> str:
+    status_code = _get_status_code(error)
+    if status_code is not None and status_code >= 400:
+        return str(status_code)
+
+    error_code = getattr(error, "error_code", None)
+    if error_code is not None:
+        return str(error_code)
+
+    return type(error).__name__
+
+
+class RequestStats:
+    """
+    Thread safe counters of the requests made by a `RequestMaker`
+    """
+
+    def __init__(self):
+        self.__counter = Counter()
+        self.__lock = threading.Lock()
+
+    def add(self, key: str, value: int = 1):
+        with self.__lock:
+            self.__counter[key] += value
+
+    def __getitem__(self, key: str) -> int:
+        return self.__counter[key]
+
+    def as_dict(self) -> Dict[str, int]:
+        with self.__lock:
+            return dict(self.__counter)
+
+    def __repr__(self):
+        return f"RequestStats({self.as_dict()})"
@@ -1 +1 @@
-from .twDataTypes import Excel, Tweet, User, deprecated
+from .twDataTypes import Excel, LazyTweet, Tweet, User, deprecated, tweet_buffer
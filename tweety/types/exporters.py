@@ -0,0 +1,204 @@
+"""
+Streaming CSV, JSON Lines and Parquet writers for Tweets.
+Every writer takes any iterable of `Tweet` (a result set, a `tweet_generator()`...) and only holds
+one row (one record batch for Parquet) in memory at a time.
+"""
+import csv
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+# name and type of every exported column, in order; `list` columns are joined with "," in CSV
+EXPORT_COLUMNS = (
+    ("id", str),
+    ("date", datetime),
+    ("author_id", str),
+    ("author_username", str),
+    ("author_name", str),
+    ("text", str),
+    ("language", str),
+    ("source", str),
+    ("is_retweet", bool),
+    ("is_quoted", bool),
+    ("is_reply", bool),
+    ("is_sensitive", bool),
+    ("likes", int),
+    ("retweet_counts", int),
+    ("reply_counts", int),
+    ("quote_counts", int),
+    ("bookmark_count", int),
+    ("views", int),
+    ("retweeted_tweet_id", str),
+    ("quoted_tweet_id", str),
+    ("replied_to_id", str),
+    ("media", list),
+    ("user_mentions", list),
+    ("urls", list),
+    ("hashtags", list),
+    ("symbols", list),
+)
+EXPORT_HEADERS = [name for name, _ in EXPORT_COLUMNS]
+
+
+def _get_id(value: Any) -> Optional[str]:
+    value = getattr(value, "id", value)
+    return None if value is None else str(value)
+
+
+def _get_int(value: Any) -> Optional[int]:
+    # views come as a string, or "Unavailable"
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _get_replied_to_id(tweet) -> Optional[str]:
+    # `replied_to` is only a Tweet with `get_reply`, otherwise it holds the screen name
+    return _get_id(tweet._get_original_tweet().get("in_reply_to_status_id_str"))
+
+
+def get_export_row(tweet) -> Dict[str, Any]:
+    """
+    Values of `tweet` for every column of `EXPORT_COLUMNS`, as plain python types
+    """
+
+    author = tweet.author
+    date = tweet.date
+    if date is not None and date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return {
+        "id": _get_id(tweet.id),
+        "date": date,
+        "author_id": _get_id(author),
+        "author_username": getattr(author, "username", None),
+        "author_name": getattr(author, "name", None),
+        "text": tweet.text,
+        "language": tweet.language,
+        "source": tweet.source,
+        "is_retweet": tweet.is_retweet,
+        "is_quoted": tweet.is_quoted,
+        "is_reply": tweet.is_reply,
+        "is_sensitive": tweet.is_sensitive,
+        "likes": _get_int(tweet.likes),
+        "retweet_counts": _get_int(tweet.retweet_counts),
+        "reply_counts": _get_int(tweet.reply_counts),
+        "quote_counts": _get_int(tweet.quote_counts),
+        "bookmark_count": _get_int(tweet.bookmark_count),
+        "views": _get_int(tweet.views),
+        "retweeted_tweet_id": _get_id(tweet.retweeted_tweet),
+        "quoted_tweet_id": _get_id(tweet.quoted_tweet),
+        "replied_to_id": _get_replied_to_id(tweet),
+        "media": [media.expanded_url for media in tweet.media or []],
+        "user_mentions": [user.screen_name for user in tweet.user_mentions or []],
+        "urls": [url["expanded_url"] for url in tweet.urls or []],
+        "hashtags": [hashtag["text"] for hashtag in tweet.hashtags or []],
+        "symbols": [
+            symbol["text"] if isinstance(symbol, dict) else symbol
+            for symbol in tweet.symbols or []
+        ],
+    }
+
+
+def _get_csv_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return ",".join(str(i) for i in value if i is not None)
+
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    return value
+
+
+def to_csv(tweets: Iterable, filename: str) -> int:
+    """
+    Write `tweets` as CSV, list columns joined with ","
+
+    :return: number of rows written
+    """
+
+    count = 0
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_HEADERS)
+        for tweet in tweets:
+            row = get_export_row(tweet)
+            writer.writerow([_get_csv_value(row[name]) for name in EXPORT_HEADERS])
+            count += 1
+
+    return count
+
+
+def _get_json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    return str(value)
+
+
+def to_jsonl(tweets: Iterable, filename: str) -> int:
+    """
+    Write `tweets` as JSON Lines, one object per Tweet
+
+    :return: number of rows written
+    """
+
+    count = 0
+    with open(filename, "w", encoding="utf-8") as f:
+        for tweet in tweets:
+            f.write(
+                json.dumps(
+                    get_export_row(tweet), ensure_ascii=False, default=_get_json_value
+                )
+            )
+            f.write("\n")
+            count += 1
+
+    return count
+
+
+def get_arrow_schema():
+    import pyarrow as pa
+
+    types = {
+        str: pa.string(),
+        datetime: pa.timestamp("s", tz="UTC"),
+        bool: pa.bool_(),
+        int: pa.int64(),
+        list: pa.list_(pa.string()),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in EXPORT_COLUMNS])
+
+
+def to_parquet(tweets: Iterable, filename: str, batch_size: int = 10_000) -> int:
+    """
+    Write `tweets` as Parquet, `batch_size` Tweets per record batch. Needs `pyarrow`
+
+    :return: number of rows written
+    """
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError(
+            "Parquet exports need pyarrow, install it with `pip install pyarrow`"
+        ) from error
+
+    schema = get_arrow_schema()
+    count = 0
+    rows: List[dict] = []
+    with pq.ParquetWriter(filename, schema) as writer:
+        for tweet in tweets:
+            rows.append(get_export_row(tweet))
+            if len(rows) >= batch_size:
+                writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+                count += len(rows)
+                rows = []
+
+        if rows or not count:
+            writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+            count += len(rows)
+
+    return count
@@ -1,4 +1,4 @@
-from typing import Literal, Optional
+from typing import Literal, Optional, Tuple, Union, get_args
 
 from ..exceptions import *
 
@@ -7,6 +7,27 @@ PROXY_TYPE_SOCKS5 = SOCKS5 = 2
 PROXY_TYPE_HTTP = HTTP = 3
 
 SearchFilter = Literal["live", "users", "photos", "videos"]
+# how `Media.best_stream` picks a video variant
+StreamPolicy = Literal["max-res", "max-bitrate", "closest", "budget"]
+
+
+def check_stream_policy(
+    policy: StreamPolicy,
+    target: Optional[Union[int, Tuple[int, int]]] = None,
+    max_bytes: Optional[int] = None,
+):
+    """
+    Raise `ValueError` if `Media.best_stream` can't pick a stream with these arguments
+    """
+
+    if policy not in get_args(StreamPolicy):
+        raise ValueError(f"Unknown stream policy: {policy}")
+
+    if policy == "closest" and target is None:
+        raise ValueError("The closest policy needs a target resolution")
+
+    if policy == "budget" and max_bytes is None:
+        raise ValueError("The budget policy needs max_bytes")
 
 
 class Proxy:
@@ -28,27 +49,31 @@ class Proxy:
     def __proxy_url__(self):
         if self.username and self.password:
             return "{}:{}@{}:{}".format(
-                self.username, self.password, self.host, self.password
+                self.username, self.password, self.host, self.port
             )
         else:
-            return "{}:{}".format(self.host, self.password)
+            return "{}:{}".format(self.host, self.port)
 
     def __parse__(self):
         proxy_url = self.__proxy_url__()
         if self.proxy_type == HTTP:
-            return dict(http=proxy_url, https=proxy_url)
+            self.url = "http://{}".format(proxy_url)
         elif self.proxy_type == SOCKS4:
-            socks_url = "socks4://{}".format(proxy_url)
-            return dict(http=socks_url, https=socks_url)
+            self.url = "socks4://{}".format(proxy_url)
         elif self.proxy_type == SOCKS5:
-            socks_url = "socks5://{}".format(proxy_url)
-            return dict(http=socks_url, https=socks_url)
+            self.url = "socks5://{}".format(proxy_url)
+        else:
+            raise ProxyParseError()
 
-        raise ProxyParseError()
+        return {"http://": self.url, "https://": self.url}
 
 
 class GenericError:
-    EXCEPTIONS = {32: InvalidCredentials, 144: InvalidTweetIdentifier}
+    EXCEPTIONS = {
+        32: InvalidCredentials,
+        88: RateLimitExceeded,
+        144: InvalidTweetIdentifier,
+    }
 
     def __init__(self, response, error_code, message=None):
         self.response = response
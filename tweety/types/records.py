@@ -0,0 +1,298 @@
+"""
+Compact `NamedTuple` records of the dict based models, for holding large numbers of tweets.
+Records are detached from the client, so `Media` / `Stream` downloads are not available on them.
+"""
+from datetime import datetime
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from .twDataTypes import Card, Choice, Media, Place, ShortUser, Stream, Tweet, User
+
+
+class UserRecord(NamedTuple):
+    id: int
+    created_at: Optional[datetime]
+    name: Optional[str]
+    screen_name: Optional[str]
+    description: Optional[str]
+    location: Optional[str]
+    followers_count: Optional[int]
+    friends_count: Optional[int]
+    favourites_count: Optional[int]
+    listed_count: Optional[int]
+    media_count: Optional[int]
+    statuses_count: Optional[int]
+    protected: Optional[bool]
+    verified: bool
+    possibly_sensitive: Optional[bool]
+    profile_image_url_https: Optional[str]
+    profile_banner_url: Optional[str]
+    pinned_tweets: Optional[Any]
+
+    @property
+    def username(self):
+        return self.screen_name
+
+    @property
+    def profile_url(self):
+        return "https://twitter.com/{}".format(self.screen_name)
+
+
+class ShortUserRecord(NamedTuple):
+    id: Optional[str]
+    name: Optional[str]
+    screen_name: Optional[str]
+
+    @property
+    def username(self):
+        return self.screen_name
+
+
+class StreamRecord(NamedTuple):
+    url: Optional[str]
+    content_type: Optional[str]
+    bitrate: Optional[int]
+    length: int
+    aspect_ratio: Optional[Any]
+    res: Optional[str]
+    width: int
+    height: int
+    pixels: int
+    size: Optional[int]
+
+
+class MediaRecord(NamedTuple):
+    id: Optional[str]
+    media_key: Optional[str]
+    type: Optional[str]
+    url: Optional[str]
+    display_url: Optional[str]
+    expanded_url: Optional[str]
+    media_url_https: Optional[str]
+    file_format: str
+    sizes: Tuple[Tuple[str, int, int], ...]
+    streams: Tuple[StreamRecord, ...]
+
+    @property
+    def direct_url(self):
+        return self.media_url_https
+
+
+class ChoiceRecord(NamedTuple):
+    name: Optional[str]
+    value: Optional[str]
+    counts: Any
+
+
+class CardRecord(NamedTuple):
+    rest_id: Optional[str]
+    name: Optional[str]
+    choices: Tuple[ChoiceRecord, ...]
+    end_time: Optional[datetime]
+    last_updated_time: Optional[datetime]
+    duration: Optional[str]
+
+
+class PlaceRecord(NamedTuple):
+    id: Optional[str]
+    name: Optional[str]
+    full_name: Optional[str]
+    country: Optional[str]
+    country_code: Optional[str]
+    url: Optional[str]
+    coordinates: Tuple[Tuple[float, float], ...]
+
+
+class TweetRecord(NamedTuple):
+    id: Any
+    date: datetime
+    author: Optional[UserRecord]
+    text: str
+    language: str
+    source: str
+    is_retweet: bool
+    is_quoted: bool
+    is_reply: bool
+    is_sensitive: bool
+    likes: int
+    retweet_counts: int
+    reply_counts: int
+    quote_counts: int
+    bookmark_count: Optional[int]
+    views: Any
+    vibe: str
+    retweeted_tweet: Optional["TweetRecord"]
+    quoted_tweet: Optional["TweetRecord"]
+    replied_to: Any
+    card: Optional[CardRecord]
+    place: Optional[PlaceRecord]
+    media: Tuple[MediaRecord, ...]
+    user_mentions: Tuple[ShortUserRecord, ...]
+    urls: Tuple[str, ...]
+    hashtags: Tuple[str, ...]
+    symbols: Tuple[Any, ...]
+    threads: Tuple["TweetRecord", ...]
+    comments: Tuple["TweetRecord", ...]
+
+    @property
+    def created_on(self):
+        return self.date
+
+    @property
+    def tweet_body(self):
+        return self.text
+
+
+def _user_record(user: User) -> UserRecord:
+    return UserRecord(
+        id=user.id,
+        created_at=user.created_at,
+        name=user.name,
+        screen_name=user.screen_name,
+        description=user.description,
+        location=user.location,
+        followers_count=user.followers_count,
+        friends_count=user.friends_count,
+        favourites_count=user.favourites_count,
+        listed_count=user.listed_count,
+        media_count=user.media_count,
+        statuses_count=user.statuses_count,
+        protected=user.protected,
+        verified=user.verified,
+        possibly_sensitive=user.possibly_sensitive,
+        profile_image_url_https=user.profile_image_url_https,
+        profile_banner_url=user.profile_banner_url,
+        pinned_tweets=user.pinned_tweets,
+    )
+
+
+def _stream_record(stream: Stream) -> StreamRecord:
+    return StreamRecord(
+        url=stream.url,
+        content_type=stream.content_type,
+        bitrate=stream.bitrate,
+        length=stream.length,
+        aspect_ratio=stream.aspect_ratio,
+        res=stream.res,
+        width=stream.width,
+        height=stream.height,
+        pixels=stream.pixels,
+        size=stream.size,
+    )
+
+
+def _media_record(media: Media) -> MediaRecord:
+    return MediaRecord(
+        id=media.id,
+        media_key=media.media_key,
+        type=media.type,
+        url=media.url,
+        display_url=media.display_url,
+        expanded_url=media.expanded_url,
+        media_url_https=media.media_url_https,
+        file_format=media.file_format,
+        sizes=tuple((size.name, size.width, size.height) for size in media.sizes),
+        streams=tuple(_stream_record(stream) for stream in media.streams),
+    )
+
+
+def _card_record(card: Card) -> CardRecord:
+    return CardRecord(
+        rest_id=card.rest_id,
+        name=card.name,
+        choices=tuple(to_record(choice) for choice in card.choices),
+        end_time=card.end_time,
+        last_updated_time=card.last_updated_time,
+        duration=card.duration,
+    )
+
+
+def _place_record(place: Place) -> PlaceRecord:
+    return PlaceRecord(
+        id=place.id,
+        name=place.name,
+        full_name=place.full_name,
+        country=place.country,
+        country_code=place.country_code,
+        url=place.url,
+        coordinates=tuple((i.latitude, i.longitude) for i in place.coordinates),
+    )
+
+
+def _tweet_record(tweet: Tweet) -> TweetRecord:
+    return TweetRecord(
+        id=tweet.id,
+        date=tweet.date,
+        author=to_record(tweet.author),
+        text=tweet.text,
+        language=tweet.language,
+        source=tweet.source,
+        is_retweet=tweet.is_retweet,
+        is_quoted=tweet.is_quoted,
+        is_reply=tweet.is_reply,
+        is_sensitive=tweet.is_sensitive,
+        likes=tweet.likes,
+        retweet_counts=tweet.retweet_counts,
+        reply_counts=tweet.reply_counts,
+        quote_counts=tweet.quote_counts,
+        bookmark_count=tweet.bookmark_count,
+        views=tweet.views,
+        vibe=tweet.vibe,
+        retweeted_tweet=to_record(tweet.retweeted_tweet),
+        quoted_tweet=to_record(tweet.quoted_tweet),
+        replied_to=to_record(tweet.replied_to),
+        card=to_record(tweet.card),
+        place=to_record(tweet.place),
+        media=tuple(_media_record(media) for media in tweet.media),
+        user_mentions=tuple(to_record(user) for user in tweet.user_mentions),
+        urls=tuple(url["expanded_url"] for url in tweet.urls),
+        hashtags=tuple(hashtag["text"] for hashtag in tweet.hashtags),
+        symbols=tuple(tweet.symbols),
+        threads=tuple(_tweet_record(thread) for thread in tweet.threads),
+        comments=tuple(_tweet_record(comment) for comment in tweet.comments),
+    )
+
+
+_CONVERTERS = (
+    (Tweet, _tweet_record),
+    (User, _user_record),
+    (Media, _media_record),
+    (Stream, _stream_record),
+    (Card, _card_record),
+    (Place, _place_record),
+)
+
+
+def to_record(obj: Any) -> Any:
+    """
+    Convert a model (`Tweet`, `User`, `ShortUser`, `Media`, `Stream`, `Card`, `Choice` or `Place`)
+    into its compact record, anything else (`None`, plain strings...) is returned untouched
+
+    :param obj: the model to convert
+
+    :return: the matching `...Record`
+    """
+
+    if isinstance(obj, ShortUser):
+        return ShortUserRecord(id=obj.id, name=obj.name, screen_name=obj.screen_name)
+
+    if isinstance(obj, Choice):
+        return ChoiceRecord(name=obj.name, value=obj.value, counts=obj.counts)
+
+    for model, converter in _CONVERTERS:
+        if isinstance(obj, model):
+            return converter(obj)
+
+    return obj
+
+
+def to_records(objects: Iterable[Any]) -> Iterator[Any]:
+    """
+    Lazily convert every model of `objects`, e.g. a `UserTweets` result or a `tweet_generator()`
+
+    :param objects: iterable of models
+
+    :return: iterator of records
+    """
+
+    for obj in objects:
+        yield to_record(obj)
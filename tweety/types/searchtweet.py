@@ -1,11 +1,14 @@
+import asyncio
 import time
 import urllib.parse
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple, Union
 
-from tweety.http import RequestMaker
-from tweety.types.n_types import SearchFilter
+from tweety.download import download_all, download_all_async
+from tweety.http import AsyncRequestMaker, RequestMaker
+from tweety.types.exporters import to_csv, to_jsonl, to_parquet
+from tweety.types.n_types import SearchFilter, StreamPolicy
 
-from . import Excel, Tweet, deprecated
+from . import Excel, LazyTweet, Tweet, deprecated, tweet_buffer
 
 
 class SearchTweets(dict):
@@ -13,13 +16,22 @@ class SearchTweets(dict):
         self,
         query: str,
         search_filter: SearchFilter,
-        http: RequestMaker,
+        http: Union[RequestMaker, AsyncRequestMaker],
         pages: int = 1,
         wait_time: int = 2,
         cursor: Optional[str] = None,
+        retain: Union[bool, int] = True,
+        lazy: bool = False,
     ):
+        """
+        :param retain: (`bool` | `int`) keep every parsed Tweet (`True`), only the current page (`False`)
+                       or the last `n` Tweets in a ring buffer (`int`)
+        :param lazy: (`bool`) build `LazyTweet` objects which only parse the fields that are read
+        """
         super().__init__()
-        self.tweets = []
+        self.retain = retain
+        self.tweet_class = LazyTweet if lazy else Tweet
+        self.tweets = tweet_buffer(retain)
         self.cursor = cursor
         self.is_next_page = True
         self.http = http
@@ -27,6 +39,7 @@ class SearchTweets(dict):
         self.search_filter: SearchFilter = search_filter
         self.pages = pages
         self.wait_time = wait_time
+        self._fetched_pages = 0
 
     @staticmethod
     def _get_entries(response: dict) -> List[dict]:
@@ -48,40 +61,81 @@ class SearchTweets(dict):
     def get_next_page(self):
         _tweets = []
         if self.is_next_page:
-            response = self.http.get_search_tweets(
-                self.query, search_filter=self.search_filter, cursor=self.cursor
-            )
-            entries = self._get_entries(response)
-
-            for entry in entries:
-                tweets = self._get_tweet_content_key(entry)
-                for tweet in tweets:
-                    try:
-                        parsed = Tweet(response, tweet, self.http)
-                        _tweets.append(parsed)
-                        # yield parsed
-                    except BaseException:
-                        pass
-
-            self.is_next_page = self._get_cursor(response)
-
-            for tweet in _tweets:
-                self.tweets.append(tweet)
-
-            self["tweets"] = self.tweets
-            self["is_next_page"] = self.is_next_page
-            self["cursor"] = self.cursor
+            _tweets = self._parse_page(self._fetch_page())
         return self, _tweets
 
-    def generator(self):
+    def _fetch_page(self) -> dict:
+        return self.http.get_search_tweets(
+            self.query, search_filter=self.search_filter, cursor=self.cursor
+        )
+
+    def _parse_page(self, response: dict) -> List[Tweet]:
+        return list(self._iter_page(response))
+
+    def _iter_page(self, response: dict) -> Iterator[Tweet]:
+        self._fetched_pages += 1
+
+        if not self.retain:
+            self.tweets.clear()
+
+        entries = self._get_entries(response)
+
+        for entry in entries:
+            tweets = self._get_tweet_content_key(entry)
+            for tweet in tweets:
+                try:
+                    parsed = self.tweet_class(response, tweet, self.http)
+                except BaseException:
+                    continue
+
+                self.tweets.append(parsed)
+                yield parsed
+
+        self.is_next_page = self._get_cursor(response)
+
+        self["tweets"] = self.tweets
+        self["is_next_page"] = self.is_next_page
+        self["cursor"] = self.cursor
+
+    def generator(self, per_page: bool = False):
+        """
+        Yield `(self, tweets)` once with the Tweets of every page
+
+        :param per_page: (`bool`) yield `(self, tweets)` for every page as soon as it is fetched instead,
+                         the next page is only requested once the previous one is consumed
+        """
+
         tweets = []
         for page in range(1, int(self.pages) + 1):
             _, new_tweets = self.get_next_page()
-            tweets = tweets + new_tweets
+            if per_page:
+                yield self, new_tweets
+            else:
+                tweets.extend(new_tweets)
+
+            if not self.is_next_page:
+                break
+
+            if page != self.pages:
+                time.sleep(self.wait_time)
+
+        if not per_page:
+            yield self, tweets
+
+    def tweet_generator(self):
+        """
+        Yield every `Tweet` as soon as it is parsed, pages are fetched on demand.
+        The Tweets are still kept on the result as `retain` says, memory only stays flat with `retain=False`
+        """
+
+        for page in range(1, int(self.pages) + 1):
+            if not self.is_next_page:
+                break
+
+            yield from self._iter_page(self._fetch_page())
 
             if self.is_next_page and page != self.pages:
                 time.sleep(self.wait_time)
-        yield self, tweets
 
     def _get_cursor(self, response: dict) -> bool:
         try:
@@ -95,8 +149,107 @@ class SearchTweets(dict):
         except KeyError:
             return False
 
-    def to_xlsx(self):
-        return Excel(self.tweets, urllib.parse.quote(self.query))
+    def download_media(
+        self,
+        directory: str = ".",
+        concurrency: int = 8,
+        segments: int = 4,
+        skip_existing: bool = True,
+        show_progress: bool = True,
+        policy: StreamPolicy = "max-res",
+        target: Optional[Union[int, Tuple[int, int]]] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Download the media of every retained Tweet, see `tweety.download.download_all`
+        """
+
+        return download_all(
+            self.tweets,
+            self.http,
+            directory,
+            concurrency,
+            segments,
+            skip_existing,
+            show_progress,
+            policy,
+            target,
+            max_bytes,
+        )
+
+    def _get_export_name(self):
+        return urllib.parse.quote(self.query)
+
+    def _get_export_tweets(self, stream: bool):
+        if not stream:
+            return self.tweets
+
+        if self._fetched_pages:
+            raise ValueError(
+                f"stream=True fetches the pages itself, but this {type(self).__name__} already "
+                f"fetched {self._fetched_pages} page(s): export the retained Tweets with stream=False"
+            )
+
+        return self.tweet_generator()
+
+    def to_xlsx(
+        self,
+        filename: Optional[str] = None,
+        write_only: bool = False,
+        stream: bool = False,
+    ):
+        """
+        :param filename: (`str`) name of the workbook, saved as `tweets-{filename}.xlsx`
+        :param write_only: (`bool`) write the rows with a write only workbook, see `Excel`
+        :param stream: (`bool`) instead of the retained Tweets, fetch the pages through `tweet_generator`
+                       and write them as they come. Implies `write_only`. The written Tweets are still
+                       kept on the result with the default `retain=True`, memory only stays flat on any
+                       number of pages with `retain=False`. Only for a result which hasn't fetched
+                       any page yet, raises `ValueError` otherwise and `TypeError` on the async results
+        """
+
+        return Excel(
+            self._get_export_tweets(stream),
+            filename or self._get_export_name(),
+            write_only or stream,
+        )
+
+    def to_csv(self, filename: Optional[str] = None, stream: bool = False):
+        """
+        Export to CSV, see `tweety.types.exporters` for the columns
+
+        :param filename: (`str`) defaults to `tweets-{name}.csv`
+        :param stream: (`bool`) write the remaining pages as they are fetched, like `to_xlsx`
+
+        :return: the filename
+        """
+
+        filename = filename or f"tweets-{self._get_export_name()}.csv"
+        to_csv(self._get_export_tweets(stream), filename)
+        return filename
+
+    def to_jsonl(self, filename: Optional[str] = None, stream: bool = False):
+        """
+        Export to JSON Lines, see `to_csv`
+        """
+
+        filename = filename or f"tweets-{self._get_export_name()}.jsonl"
+        to_jsonl(self._get_export_tweets(stream), filename)
+        return filename
+
+    def to_parquet(
+        self,
+        filename: Optional[str] = None,
+        stream: bool = False,
+        batch_size: int = 10_000,
+    ):
+        """
+        Export to Parquet in record batches of `batch_size` Tweets, see `to_csv`. Needs `pyarrow`
+        """
+
+        filename = filename or f"tweets-{self._get_export_name()}.parquet"
+        to_parquet(self._get_export_tweets(stream), filename, batch_size)
+        return filename
 
     def __getitem__(self, index: int) -> Tweet:
         return self.tweets[index]
@@ -114,3 +267,77 @@ class SearchTweets(dict):
     @deprecated
     def to_dict(self):
         return self.tweets
+
+
+class AsyncSearchTweets(SearchTweets):
+    """
+    `SearchTweets` driven by an `AsyncRequestMaker`, pages are fetched with `await`
+    """
+
+    def _get_export_tweets(self, stream: bool):
+        if stream:
+            raise TypeError(
+                f"stream=True isn't available on AsyncSearchTweets, as its pages are fetched with await: "
+                "export the retained Tweets with stream=False"
+            )
+
+        return self.tweets
+
+    async def get_next_page(self):
+        _tweets = []
+        if self.is_next_page:
+            _tweets = self._parse_page(await self._fetch_page())
+        return self, _tweets
+
+    async def download_media(
+        self,
+        directory: str = ".",
+        concurrency: int = 8,
+        segments: int = 4,
+        skip_existing: bool = True,
+        show_progress: bool = True,
+        policy: StreamPolicy = "max-res",
+        target: Optional[Union[int, Tuple[int, int]]] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        return await download_all_async(
+            self.tweets,
+            self.http,
+            directory,
+            concurrency,
+            segments,
+            skip_existing,
+            show_progress,
+            policy,
+            target,
+            max_bytes,
+        )
+
+    async def generator(self, per_page: bool = False):
+        tweets = []
+        for page in range(1, int(self.pages) + 1):
+            _, new_tweets = await self.get_next_page()
+            if per_page:
+                yield self, new_tweets
+            else:
+                tweets.extend(new_tweets)
+
+            if not self.is_next_page:
+                break
+
+            if page != self.pages:
+                await asyncio.sleep(self.wait_time)
+
+        if not per_page:
+            yield self, tweets
+
+    async def tweet_generator(self):
+        for page in range(1, int(self.pages) + 1):
+            if not self.is_next_page:
+                break
+
+            for tweet in self._iter_page(await self._fetch_page()):
+                yield tweet
+
+            if self.is_next_page and page != self.pages:
+                await asyncio.sleep(self.wait_time)
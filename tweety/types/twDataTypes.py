@@ -3,10 +3,21 @@ import os.path
 import re
 import sys
 import warnings
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
+from typing import Iterable, Optional, Tuple, Union
 
 import dateutil.parser
 import openpyxl
 
+from ..conversation import (
+    get_conversation_replies,
+    get_conversation_tweets,
+    get_tweet_id,
+)
+from .n_types import StreamPolicy, check_stream_policy
+
 
 WORKBOOK_HEADERS = [
     "Created on",
@@ -31,6 +42,94 @@ def decodeBase64(encoded_string):
     return str(base64.b64decode(bytes(encoded_string, "utf-8")))[2:-1]
 
 
+MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+@lru_cache(maxsize=64)
+def _get_timezone(offset):
+    if offset in ("+0000", "Z", "+00:00"):
+        return timezone.utc
+
+    sign = -1 if offset[0] == "-" else 1
+    offset = offset[1:].replace(":", "")
+    return timezone(sign * timedelta(hours=int(offset[:2]), minutes=int(offset[2:])))
+
+
+def _parse_created_at(date_string):
+    # "Wed Oct 10 20:19:24 +0000 2018"
+    _, month, day, clock, offset, year = date_string.split(" ")
+    hour, minute, second = clock.split(":")
+    return datetime(
+        int(year),
+        MONTHS[month],
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        tzinfo=_get_timezone(offset),
+    )
+
+
+def _parse_iso(date_string):
+    # "2023-05-26T18:41:44Z", `fromisoformat` only accepts the "Z" suffix from 3.11
+    if date_string.endswith("Z"):
+        date_string = date_string[:-1] + "+00:00"
+
+    return datetime.fromisoformat(date_string)
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_string):
+    """
+    Parse the timestamps returned by Twitter
+
+    The fixed `created_at` and ISO formats are parsed by hand, anything else
+    falls back to `dateutil.parser.parse`. Results are cached as the same
+    timestamps (i.e. the author `created_at`) repeat a lot on every page.
+    """
+
+    for parser in (_parse_created_at, _parse_iso):
+        try:
+            return parser(date_string)
+        except (ValueError, KeyError):
+            pass
+
+    return dateutil.parser.parse(date_string)
+
+
+def tweet_buffer(retain=True):
+    """
+    Container used by the result classes to hold parsed tweets
+
+    `True` keeps everything, `False` (or `0`) keeps nothing beyond the current page
+    and a positive `int` keeps only the latest `retain` tweets.
+    """
+
+    if not isinstance(retain, int):
+        raise TypeError(f"retain must be a bool or an int, not {type(retain).__name__}")
+
+    if retain < 0:
+        raise ValueError(f"retain can't be negative, got {retain}")
+
+    if retain is True or not retain:
+        return []
+
+    return deque(maxlen=int(retain))
+
+
 def deprecated(func):
     """
 
@@ -53,64 +152,63 @@ def deprecated(func):
     return new_func
 
 
+def get_workbook_row(tweet) -> list:
+    """
+    Values of `tweet` in the order of `WORKBOOK_HEADERS`
+    """
+
+    return [
+        tweet.date.replace(tzinfo=None),
+        tweet.author.name,
+        tweet.is_retweet,
+        tweet.is_reply,
+        tweet.id,
+        tweet.text,
+        tweet.language,
+        tweet.likes,
+        tweet.retweet_counts,
+        tweet.source,
+        ",".join([media.expanded_url for media in tweet.media]) if tweet.media else "",
+        ",".join([user_mention.screen_name for user_mention in tweet.user_mentions])
+        if tweet.user_mentions
+        else "",
+        ",".join([url["expanded_url"] for url in tweet.urls]) if tweet.urls else "",
+        ",".join([hashtag["text"] for hashtag in tweet.hashtags])
+        if tweet.hashtags
+        else "",
+        ",".join([symbol for symbol in tweet.symbols]) if tweet.symbols else "",
+    ]
+
+
 class Excel:
-    def __init__(self, tweets: list, filename: str):
+    def __init__(self, tweets: Iterable, filename: str, write_only: bool = False):
+        """
+        :param tweets: (`Iterable[Tweet]`) any iterable, including a generator which is consumed as rows are written
+        :param filename: (`str`) the workbook is saved as `tweets-{filename}.xlsx`
+        :param write_only: (`bool`) stream the rows to disk with a write only workbook, which keeps the memory flat
+                           for large exports but can't be read back or edited before saving
+        """
+
         self.tweets = tweets
         self.filename = f"tweets-{filename}.xlsx"
-        self.workbook = openpyxl.Workbook()
+        self.write_only = write_only
+        self.workbook = openpyxl.Workbook(write_only=write_only)
         self.worksheet = self.workbook.create_sheet("tweets")
         self._set_headers()
         self.max_row = 1
         self._write_data()
 
     def _set_headers(self):
-        for index, value in enumerate(WORKBOOK_HEADERS, start=1):
-            self.worksheet.cell(row=1, column=index).value = value
+        self.worksheet.append(WORKBOOK_HEADERS)
 
     def _write_data(self):
         for tweet in self.tweets:
-            self.worksheet[f"A{self.max_row  + 1}"] = tweet.date.replace(tzinfo=None)
-            self.worksheet[f"B{self.max_row  + 1}"] = tweet.author.name
-            self.worksheet[f"C{self.max_row  + 1}"] = tweet.is_retweet
-            self.worksheet[f"D{self.max_row  + 1}"] = tweet.is_reply
-            self.worksheet[f"E{self.max_row  + 1}"] = tweet.id
-            self.worksheet[f"F{self.max_row  + 1}"] = tweet.text
-            self.worksheet[f"G{self.max_row  + 1}"] = tweet.language
-            self.worksheet[f"H{self.max_row  + 1}"] = tweet.likes
-            self.worksheet[f"I{self.max_row  + 1}"] = tweet.retweet_counts
-            self.worksheet[f"J{self.max_row  + 1}"] = tweet.source
-            self.worksheet[f"K{self.max_row  + 1}"] = (
-                ",".join([media.expanded_url for media in tweet.media])
-                if tweet.media
-                else ""
-            )
-            self.worksheet[f"L{self.max_row  + 1}"] = (
-                ",".join(
-                    [user_mention.screen_name for user_mention in tweet.user_mentions]
-                )
-                if tweet.user_mentions
-                else ""
-            )
-            self.worksheet[f"M{self.max_row  + 1}"] = (
-                ",".join([url["expanded_url"] for url in tweet.urls])
-                if tweet.urls
-                else ""
-            )
-            self.worksheet[f"N{self.max_row  + 1}"] = (
-                ",".join([hashtag["text"] for hashtag in tweet.hashtags])
-                if tweet.hashtags
-                else ""
-            )
-            self.worksheet[f"O{self.max_row  + 1}"] = (
-                ",".join([symbol for symbol in tweet.symbols]) if tweet.symbols else ""
-            )
+            self.worksheet.append(get_workbook_row(tweet))
             self.max_row += 1
 
-        # remove the default Sheet
-        try:
-            self.workbook.remove(self.workbook.get_sheet_by_name("Sheet"))
-        except ValueError:
-            pass
+        # remove the default Sheet, write only workbooks don't have one
+        if "Sheet" in self.workbook.sheetnames:
+            self.workbook.remove(self.workbook["Sheet"])
 
         self.workbook.save(self.filename)
 
@@ -124,10 +222,13 @@ class Tweet(dict):
         get_threads=False,
         is_legacy_user=False,
         get_reply=False,
+        details=None,
     ):  # noqa
         super().__init__()
         self.http = http
         self.__raw_response = raw_response
+        # `tweet_detail` responses fetched ahead of time, see `ConversationExpander.get_related_details`
+        self._details = dict(details or {})
         self.__raw_tweet = raw_tweet
         self.__is_legacy_user = is_legacy_user
         self.__replied_to = None
@@ -137,6 +238,11 @@ class Tweet(dict):
         if get_threads:
             self._get_threads()
 
+        # the page response is only needed while parsing, holding on to it
+        # would keep every page of a long crawl alive through its tweets
+        self.__raw_response = None
+        self._details = None
+
         for key, value in vars(self).items():
             if not str(key).startswith("_"):
                 self[key] = value
@@ -152,9 +258,7 @@ class Tweet(dict):
     def _format_tweet(self):
         original_tweet = self._get_original_tweet()
         self.id = self._get_id()
-        self.created_on = self.date = dateutil.parser.parse(
-            original_tweet["created_at"]
-        )
+        self.created_on = self.date = parse_date(original_tweet["created_at"])
         self.author = self._get_author()
         self.is_retweet = self._is_retweet(original_tweet)
         self.retweeted_tweet = self._get_retweeted_tweet(
@@ -223,59 +327,42 @@ class Tweet(dict):
     def _get_retweeted_tweet(self, is_retweet, original_tweet):
         if is_retweet and original_tweet.get("retweeted_status_result"):
             retweet = original_tweet["retweeted_status_result"]["result"]
-            return Tweet(None, retweet, self.http)
+            return self.__class__(None, retweet, self.http)
 
         return None
 
+    def _get_tweet_detail(self, tweet_id):
+        tweet_id = str(tweet_id)
+        if self._details is None:
+            self._details = {}
+
+        if tweet_id not in self._details:
+            self._details[tweet_id] = self.http.get_tweet_detail(tweet_id)
+
+        return self._details[tweet_id]
+
     def _get_threads(self):
         if not self.__raw_response:
-            self.__raw_response = self.http.get_tweet_detail(self.id)
+            self.__raw_response = self._get_tweet_detail(self.id)
         if self.__raw_tweet.get("in_reply_to_status_id"):
-            conversation = self.http.get_tweet_detail(
+            conversation = self._get_tweet_detail(
                 self.__raw_tweet["in_reply_to_status_id"]
             )
             if self.__raw_tweet["in_reply_to_screen_name"] == self.author.screen_name:
-                for tweet in conversation["data"]["timeline_response"]["instructions"][
-                    0
-                ]["entries"]:
-                    self.threads.append(
-                        Tweet(
-                            None,
-                            tweet["content"]["content"]["tweetResult"]["result"],
-                            self.http,
-                        )
-                    )
+                tweets = self.threads
             else:
-                for tweet in conversation["data"]["timeline_response"]["instructions"][
-                    0
-                ]["entries"]:
-                    self.comments.append(
-                        Tweet(
-                            None,
-                            tweet["content"]["content"]["tweetResult"]["result"],
-                            self.http,
-                        )
-                    )
+                tweets = self.comments
+
+            for tweet in get_conversation_tweets(conversation):
+                tweets.append(Tweet(None, tweet, self.http))
 
-        for entry in self.__raw_response["data"]["timeline_response"]["instructions"][
-            0
-        ]["entries"]:
-            if str(entry["entryId"]).split("-")[0] == "conversationthread":
-                for item in entry["content"]["items"]:
-                    try:
-                        tweetType = item["item"]["itemContent"]["tweetDisplayType"]
-                        tweet = item["item"]["itemContent"]["tweet_results"]["result"]
-
-                        if (
-                            not self.__replied_to
-                            or self.__replied_to.id != tweet["rest_id"]
-                        ):
-                            if tweetType == "SelfThread":
-                                self.threads.append(Tweet(None, tweet, self.http))
-                            else:
-                                self.comments.append(Tweet(None, tweet, self.http))
-                    except KeyError:
-                        pass
+        replied_to_id = getattr(self.replied_to, "id", None)
+        for tweetType, tweet in get_conversation_replies(self.__raw_response):
+            if replied_to_id is None or replied_to_id != get_tweet_id(tweet):
+                if tweetType == "SelfThread":
+                    self.threads.append(Tweet(None, tweet, self.http))
+                else:
+                    self.comments.append(Tweet(None, tweet, self.http))
 
     def _get_quoted_tweet(self, is_quoted):
         raw_tweet = None
@@ -284,13 +371,13 @@ class Tweet(dict):
             try:
                 if self.__raw_tweet.get("quoted_status_result"):
                     raw_tweet = self.__raw_tweet["quoted_status_result"]["result"]
-                    return Tweet(raw_response, raw_tweet, self.http)
+                    return self.__class__(raw_response, raw_tweet, self.http)
 
                 if not raw_tweet and self.__raw_tweet.get("legacy"):
                     raw_tweet = self.__raw_tweet["legacy"]["retweeted_status_result"][
                         "result"
                     ]["quoted_status_result"]["result"]
-                    return Tweet(raw_response, raw_tweet, self.http)
+                    return self.__class__(raw_response, raw_tweet, self.http)
             except BaseException:
                 return None
 
@@ -321,14 +408,9 @@ class Tweet(dict):
     def _get_reply_to(self, is_reply, tweet):
         if is_reply and self._get_reply:
             tweet_id = tweet["in_reply_to_status_id_str"]
-            response = self.http.get_tweet_detail(tweet_id)
-            for entry in response.json()["data"][
-                "threaded_conversation_with_injections_v2"
-            ]["instructions"][0]["entries"]:
-                if str(entry["entryId"]).split("-")[0] == "tweet":
-                    raw_tweet = entry["content"]["itemContent"]["tweet_results"][
-                        "result"
-                    ]
+            response = self._get_tweet_detail(tweet_id)
+            for raw_tweet in get_conversation_tweets(response):
+                if get_tweet_id(raw_tweet) == str(tweet_id):
                     return Tweet(response, raw_tweet, self.http)
 
         elif is_reply and not self._get_reply:
@@ -359,13 +441,13 @@ class Tweet(dict):
 
     @staticmethod
     def _is_reply(original_tweet):
-        tweet_keys = list(original_tweet.keys())
         required_keys = [
             "in_reply_to_status_id_str",
             "in_reply_to_user_id_str",
             "in_reply_to_screen_name",
         ]
-        return any(x in tweet_keys and original_tweet[x] is True for x in required_keys)
+        # the keys hold ids and names, never `True`
+        return any(original_tweet.get(x) for x in required_keys)
 
     @staticmethod
     def _is_quoted(original_tweet):
@@ -477,6 +559,223 @@ class Tweet(dict):
         return [symbol for symbol in original_tweet["entities"]["symbols"]]
 
 
+class LazyTweet(Tweet):
+    """
+    `Tweet` which parses each field on first access instead of in the constructor
+
+    Item access, `get()` and `in` work for every field, and `keys()` / `items()` / `values()`,
+    `len()` and `dict(tweet)` parse the remaining fields first. Iterating yields the threads like
+    `Tweet` does. Code reading the dict storage directly (`json.dumps`) only sees the fields
+    read so far, call `materialize()` before handing it over.
+    Errors in the raw payload surface when the broken field is read rather than when the
+    object is built.
+    """
+
+    FIELDS = (
+        "id",
+        "created_on",
+        "date",
+        "author",
+        "is_retweet",
+        "retweeted_tweet",
+        "text",
+        "tweet_body",
+        "is_quoted",
+        "quoted_tweet",
+        "is_reply",
+        "is_sensitive",
+        "reply_counts",
+        "quote_counts",
+        "replied_to",
+        "bookmark_count",
+        "vibe",
+        "views",
+        "language",
+        "likes",
+        "card",
+        "place",
+        "retweet_counts",
+        "source",
+        "voice_info",
+        "media",
+        "user_mentions",
+        "urls",
+        "hashtags",
+        "symbols",
+        "threads",
+        "comments",
+    )
+
+    def _format_tweet(self):
+        self._original_tweet = self._get_original_tweet()
+        self.threads = []
+        self.comments = []
+
+    def __missing__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+
+        value = self[key] = getattr(self, key)
+        return value
+
+    def get(self, key, default=None):
+        if key in self.FIELDS:
+            return self[key]
+
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        return key in self.FIELDS or super().__contains__(key)
+
+    def __len__(self):
+        self.materialize()
+        return super().__len__()
+
+    def __bool__(self):
+        # every field ends up in the dict, no need to parse them to know it isn't empty
+        return True
+
+    def keys(self):
+        self.materialize()
+        return super().keys()
+
+    def items(self):
+        self.materialize()
+        return super().items()
+
+    def values(self):
+        self.materialize()
+        return super().values()
+
+    def materialize(self):
+        """
+        Parse every remaining field and copy it into the dict
+        """
+
+        for field in self.FIELDS:
+            self[field] = getattr(self, field)
+
+        return self
+
+    @cached_property
+    def id(self):
+        return self._get_id()
+
+    @cached_property
+    def created_on(self):
+        return parse_date(self._original_tweet["created_at"])
+
+    @property
+    def date(self):
+        return self.created_on
+
+    @cached_property
+    def author(self):
+        return self._get_author()
+
+    @cached_property
+    def is_retweet(self):
+        return self._is_retweet(self._original_tweet)
+
+    @cached_property
+    def retweeted_tweet(self):
+        return self._get_retweeted_tweet(self.is_retweet, self._original_tweet)
+
+    @cached_property
+    def text(self):
+        return self._get_tweet_text(self._original_tweet, self.is_retweet)
+
+    @property
+    def tweet_body(self):
+        return self.text
+
+    @cached_property
+    def is_quoted(self):
+        return self._is_quoted(self._original_tweet)
+
+    @cached_property
+    def quoted_tweet(self):
+        return self._get_quoted_tweet(self.is_quoted)
+
+    @cached_property
+    def is_reply(self):
+        return self._is_reply(self._original_tweet)
+
+    @cached_property
+    def is_sensitive(self):
+        return self._is_sensitive(self._original_tweet)
+
+    @cached_property
+    def reply_counts(self):
+        return self._get_reply_counts(self._original_tweet)
+
+    @cached_property
+    def quote_counts(self):
+        return self._get_quote_counts(self._original_tweet)
+
+    @cached_property
+    def replied_to(self):
+        return self._get_reply_to(self.is_reply, self._original_tweet)
+
+    @cached_property
+    def bookmark_count(self):
+        return self._get_bookmark_count(self._original_tweet)
+
+    @cached_property
+    def vibe(self):
+        return self._get_vibe()
+
+    @cached_property
+    def views(self):
+        return self._get_views()
+
+    @cached_property
+    def language(self):
+        return self._get_language(self._original_tweet)
+
+    @cached_property
+    def likes(self):
+        return self._get_likes(self._original_tweet)
+
+    @cached_property
+    def card(self):
+        return self._get_card()
+
+    @cached_property
+    def place(self):
+        return self._get_place(self._original_tweet)
+
+    @cached_property
+    def retweet_counts(self):
+        return self._get_retweet_counts(self._original_tweet)
+
+    @cached_property
+    def source(self):
+        return self._get_source(self._Tweet__raw_tweet)
+
+    voice_info = None
+
+    @cached_property
+    def media(self):
+        return self._get_tweet_media(self._original_tweet)
+
+    @cached_property
+    def user_mentions(self):
+        return self._get_tweet_mentions(self._original_tweet)
+
+    @cached_property
+    def urls(self):
+        return self._get_tweet_urls(self._original_tweet)
+
+    @cached_property
+    def hashtags(self):
+        return self._get_tweet_hashtags(self._original_tweet)
+
+    @cached_property
+    def symbols(self):
+        return self._get_tweet_symbols(self._original_tweet)
+
+
 class Media(dict):
     def __init__(self, media_dict, http):
         super().__init__()
@@ -533,26 +832,90 @@ class Media(dict):
     def __repr__(self):
         return f"Media(id={self.id}, type={self.type})"
 
-    def download(self, filename=None, show_progress=True):
-        if self.type == "photo":
-            return self.__http.download_media(self.direct_url, filename, show_progress)
-        elif self.type == "video":
-            _res = [eval(stream.res) for stream in self.streams if stream.res]
-            max_res = max(_res)
-            for stream in self.streams:
-                if eval(stream.res) == max_res:
-                    file_format = stream.content_type.split("/")[-1]
-                    if not file_format == "x-mpegURL":
-                        return self.__http.download_media(
-                            stream.url, filename, show_progress
-                        )
-        elif self.type == "animated_gif":
-            file_format = self.streams[0].content_type.split("/")[-1]
-            if not file_format == "x-mpegURL":
-                return self.__http.download_media(
-                    self.streams[0].url, filename, show_progress
+    def best_stream(
+        self,
+        policy: StreamPolicy = "max-res",
+        target: Optional[Union[int, Tuple[int, int]]] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Pick one of the video / gif streams
+
+        :param policy: (`str`) `max-res` the most pixels, `max-bitrate` the highest bitrate,
+                       `closest` the resolution nearest to `target`,
+                       `budget` the highest bitrate whose estimated size fits in `max_bytes`
+                       (the smallest stream of known size if none does)
+        :param target: (`int` | `tuple[int, int]`) height or (width, height) for the `closest` policy
+        :param max_bytes: (`int`) size limit for the `budget` policy
+
+        :return: `Stream`, `None` for photos
+        """
+
+        if not self.streams:
+            return None
+
+        check_stream_policy(policy, target, max_bytes)
+        if policy == "max-res":
+            return max(self.streams, key=lambda i: (i.pixels, i.bitrate or 0))
+
+        if policy == "max-bitrate":
+            return max(self.streams, key=lambda i: (i.bitrate or 0, i.pixels))
+
+        if policy == "closest":
+            if isinstance(target, int):
+                return min(
+                    self.streams,
+                    key=lambda i: (abs(i.height - target), -(i.bitrate or 0)),
                 )
-        return None
+
+            pixels = target[0] * target[1]
+            return min(
+                self.streams, key=lambda i: (abs(i.pixels - pixels), -(i.bitrate or 0))
+            )
+
+        fitting = [i for i in self.streams if i.size is not None and i.size <= max_bytes]
+        if fitting:
+            return max(fitting, key=lambda i: (i.bitrate or 0, i.pixels))
+
+        # the streams of unknown size can't be trusted to fit, they only come last
+        return min(self.streams, key=lambda i: (i.size is None, i.size or 0, i.pixels))
+
+    def get_download_url(
+        self,
+        policy: StreamPolicy = "max-res",
+        target: Optional[Union[int, Tuple[int, int]]] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Url `download` fetches: the photo itself or the stream picked by `best_stream`
+        """
+
+        if self.type == "photo":
+            return self.direct_url
+
+        stream = self.best_stream(policy, target, max_bytes)
+        return stream.url if stream else None
+
+    @property
+    def download_url(self):
+        return self.get_download_url()
+
+    def download(
+        self,
+        filename=None,
+        show_progress=True,
+        policy: StreamPolicy = "max-res",
+        target: Optional[Union[int, Tuple[int, int]]] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        url = self.get_download_url(policy, target, max_bytes)
+        if not url:
+            return None
+
+        return self.__http.download_media(url, filename, show_progress)
+
+
+RESOLUTION_REGEX = re.compile("/(\\d+)x(\\d+)/")
 
 
 class Stream(dict):
@@ -565,19 +928,24 @@ class Stream(dict):
         self.url = self.direct_url = self.__dictionary.get("url")
         self.length = length
         self.aspect_ratio = ratio
-        self.res = self._get_resolution()
+        self.width, self.height = self._get_resolution()
+        self.pixels = self.width * self.height
+        self.res = f"{self.width}*{self.height}" if self.pixels else None
+        # bitrate is in bits per second and length in milliseconds
+        self.size = (
+            self.bitrate * self.length // 8000 if self.bitrate and self.length else None
+        )
 
         for k, v in vars(self).items():
             if not k.startswith("_"):
                 self[k] = v
 
-    def _get_resolution(self):
-        result = re.findall("/(\\d+)x(\\d+)/", self.url)
+    def _get_resolution(self) -> Tuple[int, int]:
+        result = RESOLUTION_REGEX.search(self.url or "")
         if result:
-            result = result[0]
-            return f"{result[0]}*{result[1]}"
+            return int(result.group(1)), int(result.group(2))
 
-        return None
+        return 0, 0
 
     def __repr__(self):
         return f"Stream(content_type={self.content_type}, length={self.length}, bitrate={self.bitrate}, res={self.res})"
@@ -673,12 +1041,10 @@ class Card(dict):
                 }
                 self.choices.append(Choice(_r))
             elif _key[0] == "end" and _key[1] == "datetime":
-                self.end_time = dateutil.parser.parse(_["value"]["string_value"])
+                self.end_time = parse_date(_["value"]["string_value"])
                 # last_updated_datetime_utc
             elif _key[0] == "last" and _key[1] == "updated":
-                self.last_updated_time = dateutil.parser.parse(
-                    _["value"]["string_value"]
-                )
+                self.last_updated_time = parse_date(_["value"]["string_value"])
                 # duration_minutes
             elif _key[0] == "duration" and _key[1] == "minutes":
                 self.duration = _["value"]["string_value"]
@@ -817,7 +1183,7 @@ class User(dict):
         if not date and self._json.get("created_at"):
             date = self._json["created_at"]
 
-        return dateutil.parser.parse(date) if date else None
+        return parse_date(date) if date else None
 
     def _get_key(self, key, default=None):
         user = self._json